@@ -0,0 +1,12 @@
+"""Pre-rendered audio caches for low-latency playback"""
+
+from .audio_store import AudioFileStore, RenderedAudio
+from .greeting_cache import GreetingAudioCache
+from .phrase_cache import PhraseAudioCache
+
+__all__ = [
+    "AudioFileStore",
+    "RenderedAudio",
+    "GreetingAudioCache",
+    "PhraseAudioCache",
+]
@@ -0,0 +1,202 @@
+"""
+Rendered Audio Storage
+
+RenderedAudio is synthesized 16-bit PCM ready to be replayed as LiveKit
+audio frames. AudioFileStore keeps rendered audio on disk, one file per
+content-hash key, bounded in size with least-recently-played eviction.
+Files are written atomically, so the store can be shared by all worker
+processes on the host.
+"""
+
+import mmap
+import os
+import struct
+from typing import AsyncIterator, Iterable, Optional, Tuple, Union
+from livekit import rtc
+
+
+# On-disk header: format tag, sample rate, channel count, synthesis time in ms
+_HEADER = struct.Struct("<4sIII")
+_FORMAT = b"PCM2"
+
+_SUFFIX = ".pcm"
+
+
+class RenderedAudio:
+    """Rendered 16-bit PCM audio"""
+
+    __slots__ = ("pcm", "sample_rate", "num_channels", "synthesis_ms", "_mmap")
+
+    def __init__(
+        self,
+        pcm: Union[bytes, memoryview],
+        sample_rate: int,
+        num_channels: int,
+        synthesis_ms: int = 0
+    ):
+        self.pcm = pcm
+        self.sample_rate = sample_rate
+        self.num_channels = num_channels
+        self.synthesis_ms = synthesis_ms
+        self._mmap: Optional[mmap.mmap] = None
+
+    @classmethod
+    def from_frames(cls, frames: Iterable[rtc.AudioFrame], synthesis_ms: int = 0) -> Optional["RenderedAudio"]:
+        """
+        Join synthesized frames into one clip
+
+        Returns:
+            Audio, None if there were no frames
+        """
+        chunks = []
+        sample_rate = num_channels = None
+        for frame in frames:
+            sample_rate, num_channels = frame.sample_rate, frame.num_channels
+            chunks.append(bytes(frame.data))
+
+        if not chunks:
+            return None
+        return cls(b"".join(chunks), sample_rate, num_channels, synthesis_ms)
+
+    @property
+    def duration_ms(self) -> int:
+        """Playback duration in milliseconds"""
+        return int(len(self.pcm) / (2 * self.num_channels * self.sample_rate) * 1000)
+
+    async def frames(self, frame_ms: int = 20) -> AsyncIterator[rtc.AudioFrame]:
+        """Yield the audio as fixed-size frames for AgentSession.say(audio=...)"""
+        samples_per_channel = self.sample_rate * frame_ms // 1000
+        frame_bytes = samples_per_channel * self.num_channels * 2
+
+        for offset in range(0, len(self.pcm), frame_bytes):
+            chunk = self.pcm[offset:offset + frame_bytes]
+            yield rtc.AudioFrame(
+                data=chunk,
+                sample_rate=self.sample_rate,
+                num_channels=self.num_channels,
+                samples_per_channel=len(chunk) // (2 * self.num_channels),
+            )
+
+    def close(self):
+        """Unmap the backing file of audio read with mapped=True"""
+        if self._mmap is not None:
+            try:
+                self.pcm.release()
+                self._mmap.close()
+            except BufferError:
+                pass  # a frame still references the mapping; unmapped on GC
+            self._mmap = None
+
+
+class AudioFileStore:
+    """
+    Size-bounded on-disk store of rendered audio
+
+    A file's mtime doubles as its last-played time: reads touch it and
+    pruning removes the oldest files first. All methods do blocking I/O;
+    call them from a thread (asyncio.to_thread).
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """
+        Initialize store
+
+        Args:
+            cache_dir: Directory for audio files (created on first write)
+            max_bytes: Disk budget; least recently played files are removed
+                beyond it
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}{_SUFFIX}")
+
+    def read(self, key: str, mapped: bool = False) -> Optional[RenderedAudio]:
+        """
+        Read stored audio
+
+        Args:
+            key: Content hash key
+            mapped: Memory-map the file instead of reading it; pages are
+                loaded as frames are played, and the caller must close()
+                the returned audio
+
+        Returns:
+            Audio, None if not stored
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                if mapped:
+                    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    data = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            # mmap of an empty file
+            return None
+
+        if len(data) < _HEADER.size:
+            if mapped:
+                data.close()
+            return None
+
+        tag, sample_rate, num_channels, synthesis_ms = _HEADER.unpack_from(data)
+        if tag != _FORMAT:
+            # Written by an older version; treated as a miss and overwritten
+            if mapped:
+                data.close()
+            return None
+
+        if not mapped:
+            return RenderedAudio(data[_HEADER.size:], sample_rate, num_channels, synthesis_ms)
+
+        audio = RenderedAudio(memoryview(data)[_HEADER.size:], sample_rate, num_channels, synthesis_ms)
+        audio._mmap = data
+        return audio
+
+    def write(self, key: str, audio: RenderedAudio):
+        """Store audio atomically, then prune to the disk budget"""
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+        tmp_path = f"{self._path(key)}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(_FORMAT, audio.sample_rate, audio.num_channels, audio.synthesis_ms))
+            f.write(audio.pcm)
+        os.replace(tmp_path, self._path(key))
+        self.prune()
+
+    def prune(self):
+        """Remove least recently played files beyond max_bytes"""
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(_SUFFIX):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except FileNotFoundError:
+                pass
+
+    def usage(self) -> Tuple[int, int]:
+        """Number of stored files and their total size in bytes"""
+        files = total = 0
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(_SUFFIX):
+                        files += 1
+                        total += entry.stat().st_size
+        except FileNotFoundError:
+            pass
+        return files, total
@@ -0,0 +1,159 @@
+"""
+Greeting Audio Cache
+
+Inbound calls open with a greeting that is almost always the same sentence
+per agent. Rendering it through TTS on every call costs a synthesis round
+trip of dead air. This cache keeps the rendered PCM per (agent, TTS
+provider, voice, greeting text) in memory and on disk, so calls after the
+first play it back immediately.
+"""
+
+import asyncio
+import hashlib
+import time
+import logging
+from typing import Dict, Optional, Set
+from utils.lru_cache import LRUCache
+from .audio_store import AudioFileStore, RenderedAudio
+
+
+logger = logging.getLogger(__name__)
+
+
+class GreetingAudioCache:
+    """
+    Two-level (memory + disk) cache of rendered greetings
+
+    Keys are content hashes, so a changed greeting text, voice, or TTS
+    provider is simply a new key; old renders age out of the LRU. The
+    disk level is shared by all worker processes on the host.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_memory_bytes: int = 32 * 1024 * 1024,
+        max_disk_bytes: int = 256 * 1024 * 1024
+    ):
+        """
+        Initialize greeting cache
+
+        Args:
+            cache_dir: Directory for rendered greetings (None = memory only)
+            max_memory_bytes: In-memory budget for PCM data
+            max_disk_bytes: On-disk budget; least recently played files
+                are removed beyond it
+        """
+        self.cache_dir = cache_dir
+        self._disk = AudioFileStore(cache_dir, max_disk_bytes) if cache_dir else None
+        self._memory: LRUCache[str, RenderedAudio] = LRUCache(
+            max_size=10_000,
+            max_bytes=max_memory_bytes,
+            sizeof=lambda audio: len(audio.pcm)
+        )
+        self._rendering: Dict[str, asyncio.Task] = {}
+        self._background_tasks: Set[asyncio.Task] = set()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.renders = 0
+        self.render_failures = 0
+
+    @staticmethod
+    def make_key(agent_id: str, tts_provider: str, voice: Optional[str], text: str) -> str:
+        """Content hash identifying one rendered greeting"""
+        material = "\x1f".join([agent_id, tts_provider, voice or "", text])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[RenderedAudio]:
+        """
+        Look up a rendered greeting
+
+        Returns:
+            Audio if cached in memory or on disk, None otherwise
+        """
+        audio = self._memory.get(key)
+        if audio is None and self._disk is not None:
+            try:
+                audio = await asyncio.to_thread(self._disk.read, key)
+            except OSError as e:
+                logger.warning(f"Could not read cached greeting {key[:12]}: {e}")
+            if audio is not None:
+                self._memory.put(key, audio)
+
+        if audio is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return audio
+
+    async def render(self, key: str, tts, text: str) -> Optional[RenderedAudio]:
+        """
+        Synthesize a greeting and store it (one render per key at a time)
+
+        Args:
+            key: Cache key from make_key()
+            tts: livekit.agents TTS instance
+            text: Greeting text
+
+        Returns:
+            Rendered audio, None on failure
+        """
+        task = self._rendering.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._render(key, tts, text))
+            self._rendering[key] = task
+            task.add_done_callback(lambda _: self._rendering.pop(key, None))
+        return await asyncio.shield(task)
+
+    def render_in_background(self, key: str, tts, text: str):
+        """Start render() without waiting for it"""
+        task = asyncio.ensure_future(self.render(key, tts, text))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _render(self, key: str, tts, text: str) -> Optional[RenderedAudio]:
+        start_time = time.time()
+        frames = []
+
+        try:
+            async with tts.synthesize(text) as stream:
+                async for event in stream:
+                    frames.append(event.frame)
+        except Exception as e:
+            self.render_failures += 1
+            logger.warning(f"Greeting render failed: {e}")
+            return None
+
+        synthesis_ms = int((time.time() - start_time) * 1000)
+        audio = RenderedAudio.from_frames(frames, synthesis_ms)
+        if audio is None:
+            self.render_failures += 1
+            return None
+
+        self._memory.put(key, audio)
+        self.renders += 1
+
+        if self._disk is not None:
+            try:
+                await asyncio.to_thread(self._disk.write, key, audio)
+            except OSError as e:
+                logger.warning(f"Could not write cached greeting {key[:12]}: {e}")
+
+        logger.info(
+            f"Rendered greeting {key[:12]} ({audio.duration_ms}ms audio) "
+            f"in {synthesis_ms}ms"
+        )
+        return audio
+
+    def get_metrics(self) -> Dict[str, int]:
+        """Cache counters"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "renders": self.renders,
+            "render_failures": self.render_failures,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory.total_bytes,
+        }
@@ -0,0 +1,195 @@
+"""
+TTS Phrase Cache
+
+Agents repeat some utterances verbatim call after call: hold messages,
+confirmations, closings. This cache stores the synthesized audio of an
+allowlist of such static phrases on disk, keyed by a hash of (TTS
+provider, voice, normalized text), and replays it instead of calling the
+TTS provider again. Reads are memory-mapped, so hot phrases are served
+from the OS page cache shared by all worker processes.
+"""
+
+import asyncio
+import hashlib
+import re
+import time
+import unicodedata
+import logging
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, List, Optional, Set
+from livekit import rtc
+from .audio_store import AudioFileStore, RenderedAudio
+
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class PhraseAudioCache:
+    """
+    Content-addressed cache of synthesized static phrases
+
+    Wraps an agent's TTS node. Text is only held back while it could
+    still be one of the allowlisted phrases; as soon as it diverges from
+    all of them (for LLM replies, usually within the first chunk), the
+    utterance streams straight to the TTS. Utterances that turn out to be
+    an allowlisted phrase are looked up; on a miss the synthesized frames
+    are streamed as usual and stored once the utterance completes
+    (interrupted ones are dropped). Nothing outside the allowlist is
+    written to disk.
+    """
+
+    def __init__(self, cache_dir: str, phrases: Iterable[str], max_disk_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize phrase cache
+
+        Args:
+            cache_dir: Directory for synthesized phrases
+            phrases: Static phrases to cache (compared after normalize())
+            max_disk_bytes: On-disk budget; least recently played phrases
+                are removed beyond it
+        """
+        self.phrases = {self.normalize(phrase) for phrase in phrases if phrase.strip()}
+        self._disk = AudioFileStore(cache_dir, max_disk_bytes)
+        self._background_tasks: Set[asyncio.Task] = set()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.stored = 0
+        self.saved_synthesis_ms = 0
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Canonical form of an utterance: NFKC, whitespace collapsed and trimmed"""
+        return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+    def _may_be_phrase(self, text: str) -> bool:
+        """Whether text so far is the start of an allowlisted phrase"""
+        text = self.normalize(text)
+        return any(phrase.startswith(text) for phrase in self.phrases)
+
+    @classmethod
+    def make_key(cls, tts_provider: str, voice: Optional[str], text: str) -> str:
+        """Content hash identifying one synthesized phrase"""
+        material = "\x1f".join([tts_provider, voice or "", cls.normalize(text)])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    async def lookup(self, key: str) -> Optional[RenderedAudio]:
+        """
+        Memory-map a stored phrase
+
+        Returns:
+            Audio (the caller must close() it), None if not stored
+        """
+        try:
+            return await asyncio.to_thread(self._disk.read, key, True)
+        except OSError as e:
+            logger.warning(f"Could not read cached phrase {key[:12]}: {e}")
+            return None
+
+    def _store_in_background(self, key: str, audio: RenderedAudio):
+        async def store():
+            try:
+                await asyncio.to_thread(self._disk.write, key, audio)
+                self.stored += 1
+            except OSError as e:
+                logger.warning(f"Could not write cached phrase {key[:12]}: {e}")
+
+        task = asyncio.ensure_future(store())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def synthesize(
+        self,
+        tts_provider: str,
+        voice: Optional[str],
+        text: AsyncIterable[str],
+        tts_node: Callable[[AsyncIterable[str]], AsyncIterable[rtc.AudioFrame]]
+    ) -> AsyncIterator[rtc.AudioFrame]:
+        """
+        Synthesize an utterance, from the cache when possible
+
+        Args:
+            tts_provider: TTS provider name (part of the key)
+            voice: Voice ID (part of the key)
+            text: Text stream of the utterance, as given to Agent.tts_node
+            tts_node: Live synthesis, called with a text stream
+
+        Yields:
+            Audio frames of the utterance
+        """
+        text_iter = text.__aiter__()
+        buffered: List[str] = []
+        complete = True
+        async for chunk in text_iter:
+            buffered.append(chunk)
+            if not self._may_be_phrase("".join(buffered)):
+                complete = False
+                break
+
+        if not complete:
+            self.bypassed += 1
+
+            async def replay() -> AsyncIterator[str]:
+                for chunk in buffered:
+                    yield chunk
+                async for chunk in text_iter:
+                    yield chunk
+
+            async for frame in tts_node(replay()):
+                yield frame
+            return
+
+        phrase = "".join(buffered)
+
+        async def once() -> AsyncIterator[str]:
+            yield phrase
+
+        if self.normalize(phrase) not in self.phrases:
+            # Only the start of an allowlisted phrase
+            self.bypassed += 1
+            async for frame in tts_node(once()):
+                yield frame
+            return
+
+        key = self.make_key(tts_provider, voice, phrase)
+        audio = await self.lookup(key)
+        if audio is not None:
+            self.hits += 1
+            self.saved_synthesis_ms += audio.synthesis_ms
+            try:
+                async for frame in audio.frames():
+                    yield frame
+            finally:
+                audio.close()
+            return
+
+        self.misses += 1
+        start_time = time.perf_counter()
+        frames = []
+        async for frame in tts_node(once()):
+            frames.append(frame)
+            yield frame
+
+        # Only reached if the utterance played to the end
+        synthesis_ms = int((time.perf_counter() - start_time) * 1000)
+        audio = RenderedAudio.from_frames(frames, synthesis_ms)
+        if audio is not None:
+            self._store_in_background(key, audio)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Hit rate, saved synthesis time and disk usage"""
+        lookups = self.hits + self.misses
+        files, disk_bytes = self._disk.usage()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "bypassed": self.bypassed,
+            "stored": self.stored,
+            "saved_synthesis_ms": self.saved_synthesis_ms,
+            "disk_entries": files,
+            "disk_bytes": disk_bytes,
+        }
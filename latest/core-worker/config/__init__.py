@@ -2,5 +2,17 @@
 
 from .config_models import AgentConfig, RuntimeConfig
 from .agent_config_loader import AgentConfigLoader
+from .snapshot_store import ConfigSnapshotStore
+from .shared_cache import SharedConfigCache
+from .invalidation_subscriber import ConfigInvalidationSubscriber
+from .backend_endpoints import EndpointSelector
 
-__all__ = ["AgentConfig", "RuntimeConfig", "AgentConfigLoader"]
+__all__ = [
+    "AgentConfig",
+    "RuntimeConfig",
+    "AgentConfigLoader",
+    "ConfigSnapshotStore",
+    "SharedConfigCache",
+    "ConfigInvalidationSubscriber",
+    "EndpointSelector",
+]
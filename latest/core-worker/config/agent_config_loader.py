@@ -7,65 +7,280 @@ Fetches agent configurations from backend API with intelligent caching
 import asyncio
 import time
 import logging
-from typing import Optional, Dict
+from typing import Awaitable, Callable, Optional, Dict, List, Set, Tuple, TypeVar, Union
 import aiohttp
-from .config_models import AgentConfig, CachedConfig, ConfigFetchResult
+from pydantic import ValidationError
+from utils.histogram import LatencyHistogram
+from utils.lru_cache import LRUCache
+from utils.resilience import AdaptiveTimeout, CircuitBreaker
+from .config_models import AgentConfig, CachedConfig, CampaignOverlay, ConfigFetchResult, RuntimeConfigResponse
+from .snapshot_store import ConfigSnapshotStore
+from .backend_endpoints import EndpointSelector
+from .prompt_store import PromptStore
+from .shared_cache import SharedConfigCache
 
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Single-flight key prefix for campaign overlay fetches
+OVERLAY_KEY_PREFIX = "overlay|"
+
+
+class _NotFound:
+    """Marker for a definitive "no such agent" answer (404 / success=false)"""
+
+    def __repr__(self) -> str:
+        return "NOT_FOUND"
+
+
+NOT_FOUND = _NotFound()
+
+
+class _KeyIndex:
+    """agent -> keys and campaign -> keys secondary indexes over cache keys"""
+
+    def __init__(self):
+        self._agent_keys: Dict[str, Set[str]] = {}
+        self._campaign_keys: Dict[str, Set[str]] = {}
+
+    def add(self, cache_key: str):
+        """Register a cache key"""
+        agent_id, _, campaign_id = cache_key.partition(":")
+        self._agent_keys.setdefault(agent_id, set()).add(cache_key)
+        if campaign_id:
+            self._campaign_keys.setdefault(campaign_id, set()).add(cache_key)
+
+    def remove(self, cache_key: str):
+        """Drop a cache key"""
+        agent_id, _, campaign_id = cache_key.partition(":")
+        for index, value in ((self._agent_keys, agent_id), (self._campaign_keys, campaign_id)):
+            keys = index.get(value)
+            if keys is not None:
+                keys.discard(cache_key)
+                if not keys:
+                    del index[value]
+
+    def select(self, agent_id: Optional[str] = None, campaign_id: Optional[str] = None) -> Set[str]:
+        """Keys for an agent, a campaign, or one agent:campaign pair"""
+        if agent_id is not None and campaign_id is not None:
+            return self._agent_keys.get(agent_id, set()) & self._campaign_keys.get(campaign_id, set())
+        if agent_id is not None:
+            return set(self._agent_keys.get(agent_id, ()))
+        if campaign_id is not None:
+            return set(self._campaign_keys.get(campaign_id, ()))
+        return set()
+
+    def clear(self):
+        """Remove all keys"""
+        self._agent_keys.clear()
+        self._campaign_keys.clear()
+
 
 class AgentConfigLoader:
     """
     Loads agent configurations from backend API with caching
 
     Features:
-    - 5-minute TTL cache to reduce database load
+    - 5-minute TTL cache to reduce database load (O(1) LRU eviction)
     - Async HTTP client with connection pooling
+    - Single-flight fetches: concurrent misses on one key share one API call
+    - Conditional refetch (ETag / If-None-Match): 304 just extends the TTL
+    - Optional stale-while-revalidate window past the TTL
+    - Optional refresh-ahead of hot keys shortly before they expire
+    - Negative cache: unknown/disabled agents skip the API for a short TTL
+    - Circuit breaker and latency-adaptive timeouts around API fetches
+    - Multiple backend endpoints with latency-aware selection and optional
+      hedged requests
+    - Optional byte budget, with large prompts compressed and deduplicated
     - Fallback to stale cache on API failure
+    - Optional on-disk snapshot for warm restarts and backend outages
+    - Optional host-wide cache shared by all job processes (one fetch per host)
+    - Optional base-config + campaign-overlay caching (one base per agent)
     - Fallback to default config if no cache available
-    - Detailed logging and metrics
+    - Detailed logging and metrics, including load latency histograms
     """
 
     def __init__(
         self,
-        backend_url: str,
+        backend_url: Union[str, List[str]],
         cache_ttl: int = 300,  # 5 minutes
         max_cache_size: int = 1000,
-        request_timeout: int = 5
+        request_timeout: int = 5,
+        stale_while_revalidate: int = 0,
+        refresh_ahead_window: int = 0,
+        refresh_ahead_budget: int = 5,
+        refresh_ahead_min_hits: int = 2,
+        snapshot_store: Optional[ConfigSnapshotStore] = None,
+        campaign_overlays: bool = False,
+        shared_cache: Optional[SharedConfigCache] = None,
+        negative_cache_ttl: int = 30,
+        negative_cache_size: int = 1000,
+        breaker_failure_threshold: int = 5,
+        breaker_reset_timeout: float = 30.0,
+        min_request_timeout: float = 1.0,
+        hedge_requests: bool = False,
+        max_cache_bytes: int = 0,
+        compress_threshold: int = 1024
     ):
         """
         Initialize config loader
 
         Args:
-            backend_url: Backend API base URL (e.g., http://localhost:3000)
+            backend_url: Backend API base URL (e.g., http://localhost:3000), or
+                several as a list or comma-separated string; each request
+                goes to the fastest healthy one
             cache_ttl: Cache time-to-live in seconds (default: 300 = 5 min)
             max_cache_size: Maximum number of cached configs
-            request_timeout: HTTP request timeout in seconds
+            request_timeout: Max HTTP request timeout in seconds (the actual
+                timeout adapts to observed backend p99 within
+                [min_request_timeout, request_timeout])
+            stale_while_revalidate: Seconds past cache_ttl (soft TTL) during which
+                a cached config is returned immediately and refreshed in the
+                background. Loads only block on the API after
+                cache_ttl + stale_while_revalidate (hard TTL). 0 disables.
+            refresh_ahead_window: Seconds before expiry in which hot keys are
+                re-fetched by a background scheduler. 0 disables.
+            refresh_ahead_budget: Max refresh-ahead fetches started per second
+            refresh_ahead_min_hits: Min decayed access count for a key to be
+                considered hot
+            snapshot_store: Optional persistent store of last known good configs,
+                read per key when the backend fails, bulk-loaded by
+                load_snapshot() and updated after each fetch
+            campaign_overlays: Cache each agent's base config once and campaign
+                overrides as small overlays composed on read, instead of one
+                full config per agent:campaign. Requires the backend overlay
+                endpoint; disabled automatically if it is missing.
+            shared_cache: Optional host-wide second-level cache shared by all
+                worker processes on the node
+            negative_cache_ttl: Seconds to remember that an agent/campaign was
+                not found (404 or success=false) before asking the API again.
+                0 disables.
+            negative_cache_size: Max remembered not-found keys
+            breaker_failure_threshold: Consecutive API failures that open the
+                circuit breaker
+            breaker_reset_timeout: Seconds the breaker stays open before
+                letting a probe request through
+            min_request_timeout: Lower bound for the adaptive request timeout
+            hedge_requests: Send a second runtime-config request to the next
+                best endpoint when the first is slower than its p95
+            max_cache_bytes: Approximate memory budget for cached configs;
+                least recently used entries are evicted beyond it. 0 = only
+                max_cache_size applies.
+            compress_threshold: system_prompt/personality values of at least
+                this many bytes are stored zlib-compressed and shared between
+                agents with identical text. 0 disables compression.
         """
-        self.backend_url = backend_url.rstrip('/')
+        self.endpoints = EndpointSelector(backend_url)
+        self.backend_url = self.endpoints.primary.url
         self.cache_ttl = cache_ttl
         self.max_cache_size = max_cache_size
         self.request_timeout = request_timeout
+        self.stale_while_revalidate = stale_while_revalidate
+        self.refresh_ahead_window = refresh_ahead_window
+        self.refresh_ahead_budget = refresh_ahead_budget
+        self.refresh_ahead_min_hits = refresh_ahead_min_hits
+        self.snapshot_store = snapshot_store
+        self.campaign_overlays = campaign_overlays
+        self.shared_cache = shared_cache
+        self.negative_cache_ttl = negative_cache_ttl
+        self.hedge_requests = hedge_requests
+
+        # In-memory cache (LRU eviction, TTL checked lazily on read); configs
+        # are stored packed, with large prompts compressed
+        self._prompts = PromptStore(compress_threshold=compress_threshold)
+        self._cache: LRUCache[str, CachedConfig] = LRUCache(
+            max_size=max_cache_size,
+            ttl=cache_ttl,
+            max_bytes=max_cache_bytes or None,
+            sizeof=lambda entry: entry.nbytes
+        )
+
+        # Secondary index over cache keys for targeted invalidation
+        self._index = _KeyIndex()
+
+        # Keys the backend says don't exist (cache_key -> time of the 404)
+        self._negative: LRUCache[str, float] = LRUCache(
+            max_size=max(negative_cache_size, 1),
+            ttl=negative_cache_ttl
+        )
+        self._negative_index = _KeyIndex()
+
+        # Campaign overrides (agent_id:campaign_id -> overlay), when enabled
+        self._overlays: LRUCache[str, CampaignOverlay] = LRUCache(max_size=max_cache_size, ttl=cache_ttl)
+        self._overlay_index = _KeyIndex()
 
-        # In-memory cache
-        self._cache: Dict[str, CachedConfig] = {}
+        # In-flight API fetches, keyed by cache key (single-flight)
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # Cleared once the backend answers 404/405 on the batch endpoint
+        self._batch_supported = True
+
+        # In-flight fetch tasks invalidated before they completed (not cached,
+        # not joined by later callers)
+        self._superseded: Set[asyncio.Future] = set()
+
+        # Strong refs to fire-and-forget background tasks
+        self._background_tasks: Set[asyncio.Task] = set()
+
+        # Refresh-ahead state: decayed per-key access counts, the expiry each
+        # refreshed entry would have hit without refresh-ahead, and the task
+        self._access_counts: Dict[str, float] = {}
+        self._refreshed_ahead: Dict[str, float] = {}
+        self._refresh_ahead_task: Optional[asyncio.Task] = None
+
+        # One-time warm start from the snapshot store
+        self._snapshot_loaded: Optional[asyncio.Future] = None
 
         # HTTP session (connection pooling)
         self._session: Optional[aiohttp.ClientSession] = None
 
+        # Backend protection: fail fast while down, size timeouts from p99
+        self._breaker = CircuitBreaker(
+            "config-backend",
+            failure_threshold=breaker_failure_threshold,
+            reset_timeout=breaker_reset_timeout
+        )
+        self._timeout = AdaptiveTimeout(min_timeout=min_request_timeout, max_timeout=request_timeout)
+
+        # load() latency: overall and per "source/outcome"
+        self._latency = LatencyHistogram()
+        self._latency_by_result: Dict[str, LatencyHistogram] = {}
+
         # Metrics
         self._metrics = {
             "total_requests": 0,
             "cache_hits": 0,
             "cache_misses": 0,
+            "coalesced_requests": 0,
+            "shared_cache_hits": 0,
+            "stale_while_revalidate_hits": 0,
+            "background_refreshes": 0,
+            "refresh_ahead_fetches": 0,
+            "refresh_ahead_failures": 0,
+            "refresh_ahead_fetch_ms": 0,
+            "refresh_ahead_saved_misses": 0,
             "api_successes": 0,
             "api_failures": 0,
+            "api_not_modified": 0,
+            "api_not_found": 0,
+            "circuit_open_rejections": 0,
+            "negative_hits": 0,
+            "invalidations": 0,
             "fallback_to_stale": 0,
-            "fallback_to_default": 0
+            "fallback_to_snapshot": 0,
+            "fallback_to_default": 0,
+            "snapshot_entries_loaded": 0,
+            "overlay_hits": 0,
+            "overlay_misses": 0,
+            "overlay_failures": 0
         }
 
-        logger.info(f"AgentConfigLoader initialized: backend={backend_url}, cache_ttl={cache_ttl}s")
+        logger.info(
+            f"AgentConfigLoader initialized: backend={', '.join(e.url for e in self.endpoints.endpoints)}, "
+            f"cache_ttl={cache_ttl}s"
+        )
 
     async def _ensure_session(self):
         """Ensure HTTP session exists"""
@@ -74,16 +289,33 @@ class AgentConfigLoader:
             self._session = aiohttp.ClientSession(timeout=timeout)
 
     async def close(self):
-        """Close HTTP session"""
+        """Cancel background refreshes and close HTTP session"""
+        for task in list(self._background_tasks):
+            task.cancel()
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
         if self._session and not self._session.closed:
             await self._session.close()
 
+        if self.snapshot_store:
+            await asyncio.get_running_loop().run_in_executor(None, self.snapshot_store.close)
+
+        if self.shared_cache:
+            await asyncio.get_running_loop().run_in_executor(None, self.shared_cache.close)
+
     def _make_cache_key(self, agent_id: str, campaign_id: Optional[str] = None) -> str:
         """Generate cache key"""
         if campaign_id:
             return f"{agent_id}:{campaign_id}"
         return agent_id
 
+    def _remove_from_cache(self, cache_key: str):
+        """Remove one entry and its index/refresh-ahead bookkeeping"""
+        if self._cache.pop(cache_key) is not None:
+            self._index.remove(cache_key)
+        self._refreshed_ahead.pop(cache_key, None)
+
     def _get_from_cache(self, cache_key: str, ignore_ttl: bool = False) -> Optional[AgentConfig]:
         """
         Get config from cache
@@ -95,89 +327,367 @@ class AgentConfigLoader:
         Returns:
             Cached config if found and valid, None otherwise
         """
-        if cache_key not in self._cache:
+        cached = self._cache.get(cache_key, ignore_ttl=ignore_ttl)
+        if cached is None:
+            if cache_key in self._cache:
+                logger.debug(f"Cache entry expired for {cache_key}")
+            return None
+
+        logger.debug(f"Cache hit for {cache_key} (age: {cached.age_seconds(time.time()):.1f}s)")
+        return cached.config
+
+    def _get_revalidatable(self, cache_key: str) -> Optional[AgentConfig]:
+        """
+        Get an expired config that is still inside the stale-while-revalidate window
+
+        Args:
+            cache_key: Cache key
+
+        Returns:
+            Cached config if past soft TTL but within hard TTL, None otherwise
+        """
+        if self.stale_while_revalidate <= 0:
             return None
 
-        cached = self._cache[cache_key]
-        current_time = time.time()
+        cached = self._cache.get(cache_key, ignore_ttl=True)
+        if cached is None:
+            return None
 
-        if not ignore_ttl and cached.is_expired(current_time):
-            logger.debug(f"Cache entry expired for {cache_key} (age: {cached.age_seconds(current_time):.1f}s)")
+        if cached.age_seconds(time.time()) > self.cache_ttl + self.stale_while_revalidate:
             return None
 
-        logger.debug(f"Cache hit for {cache_key} (age: {cached.age_seconds(current_time):.1f}s)")
         return cached.config
 
-    def _put_in_cache(self, cache_key: str, config: AgentConfig):
+    def _refresh_in_background(
+        self,
+        cache_key: str,
+        agent_id: str,
+        campaign_id: Optional[str] = None
+    ):
+        """
+        Refresh a cache entry without blocking the caller
+
+        No-op if a fetch for this key is already in flight (unless that
+        fetch has been invalidated).
+        """
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None and inflight not in self._superseded:
+            return
+
+        self._metrics["background_refreshes"] += 1
+        task = asyncio.ensure_future(self._fetch_coalesced(cache_key, agent_id, campaign_id))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _record_access(self, cache_key: str):
+        """Track key popularity and credit hits that refresh-ahead turned from misses"""
+        if self.refresh_ahead_window <= 0:
+            return
+
+        self._access_counts[cache_key] = self._access_counts.get(cache_key, 0.0) + 1.0
+
+        original_expiry = self._refreshed_ahead.get(cache_key)
+        if original_expiry is not None and time.time() > original_expiry:
+            # Without the early refresh this load would have been a miss
+            del self._refreshed_ahead[cache_key]
+            self._metrics["refresh_ahead_saved_misses"] += 1
+
+    def _ensure_refresh_ahead(self):
+        """Start the refresh-ahead scheduler on the running loop if enabled"""
+        if self.refresh_ahead_window <= 0:
+            return
+        if self._refresh_ahead_task is not None and not self._refresh_ahead_task.done():
+            return
+
+        self._refresh_ahead_task = asyncio.ensure_future(self._refresh_ahead_loop())
+        self._background_tasks.add(self._refresh_ahead_task)
+        self._refresh_ahead_task.add_done_callback(self._background_tasks.discard)
+        logger.info(
+            f"Refresh-ahead scheduler started (window={self.refresh_ahead_window}s, "
+            f"budget={self.refresh_ahead_budget}/s)"
+        )
+
+    async def _refresh_ahead_loop(self):
+        """
+        Once a second, re-fetch the hottest keys that are about to expire
+
+        Access counts decay with a 60s half-life so the ranking follows
+        current traffic. At most refresh_ahead_budget fetches start per tick.
+        """
+        decay = 0.5 ** (1 / 60)
+
+        while True:
+            await asyncio.sleep(1.0)
+            now = time.time()
+
+            candidates = []
+            for cache_key in list(self._access_counts):
+                hits = self._access_counts[cache_key] * decay
+                if hits < 0.1 or cache_key not in self._cache:
+                    del self._access_counts[cache_key]
+                    self._refreshed_ahead.pop(cache_key, None)
+                    continue
+                self._access_counts[cache_key] = hits
+
+                if hits < self.refresh_ahead_min_hits or cache_key in self._inflight:
+                    continue
+
+                expires_at = self._cache.expires_at(cache_key)
+                if expires_at is None or not (now < expires_at <= now + self.refresh_ahead_window):
+                    continue
+
+                candidates.append((hits, cache_key, expires_at))
+
+            candidates.sort(reverse=True)
+            for _, cache_key, expires_at in candidates[:self.refresh_ahead_budget]:
+                self._refreshed_ahead[cache_key] = expires_at
+                task = asyncio.ensure_future(self._refresh_ahead_one(cache_key))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+
+    async def _refresh_ahead_one(self, cache_key: str):
+        """Re-fetch one key ahead of expiry and account for its cost"""
+        agent_id, _, campaign_id = cache_key.partition(":")
+        start_time = time.time()
+        self._metrics["refresh_ahead_fetches"] += 1
+
+        config = await self._fetch_coalesced(cache_key, agent_id, campaign_id or None)
+
+        self._metrics["refresh_ahead_fetch_ms"] += int((time.time() - start_time) * 1000)
+        if not config:
+            self._metrics["refresh_ahead_failures"] += 1
+            self._refreshed_ahead.pop(cache_key, None)
+
+    def _put_in_cache(
+        self,
+        cache_key: str,
+        config: AgentConfig,
+        cached_at: Optional[float] = None,
+        etag: Optional[str] = None
+    ):
         """
         Store config in cache
 
         Args:
             cache_key: Cache key
             config: Agent configuration to cache
+            cached_at: When the config was fetched (default: now)
+            etag: Backend validator for conditional refetch
         """
-        # Evict oldest entries if cache is full
-        if len(self._cache) >= self.max_cache_size:
-            # Simple LRU: remove oldest entry
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].cached_at)
-            del self._cache[oldest_key]
-            logger.debug(f"Cache full, evicted {oldest_key}")
+        now = time.time()
+        cached_at = now if cached_at is None else cached_at
 
-        # Store new entry
-        self._cache[cache_key] = CachedConfig(
-            config=config,
-            cached_at=time.time(),
+        evicted = self._cache.put(cache_key, CachedConfig(
+            config=self._prompts.pack(config),
+            cached_at=cached_at,
             cache_key=cache_key,
-            ttl=self.cache_ttl
-        )
+            ttl=self.cache_ttl,
+            etag=etag
+        ), ttl=self.cache_ttl - (now - cached_at))
+        self._index.add(cache_key)
+        if self._negative.pop(cache_key) is not None:
+            self._negative_index.remove(cache_key)
+        for evicted_key, _ in evicted:
+            self._index.remove(evicted_key)
+            self._refreshed_ahead.pop(evicted_key, None)
+            logger.debug(f"Cache full, evicted least recently used {evicted_key}")
         logger.debug(f"Cached config for {cache_key}")
 
+    async def load_snapshot(self):
+        """
+        Warm the cache from the snapshot store (once per loader)
+
+        Reads and validates up to max_cache_size of the newest rows, so it
+        belongs in a long-lived process (the worker's host services), not
+        in a job process's first load(). Entries still within cache_ttl are
+        also published to the shared cache for the job processes. load()
+        itself only reads the single key it needs, on its fallback path.
+        """
+        if self.snapshot_store is None:
+            return
+
+        if self._snapshot_loaded is None:
+            self._snapshot_loaded = asyncio.ensure_future(self._load_snapshot())
+        await asyncio.shield(self._snapshot_loaded)
+
+    async def _load_snapshot(self):
+        """Insert snapshot entries with their original fetch time"""
+        start_time = time.time()
+        snapshots = await self.snapshot_store.load_all(limit=self.max_cache_size)
+
+        loaded = 0
+        for cache_key, (config, saved_at, etag) in snapshots.items():
+            if cache_key in self._cache:
+                continue
+            self._put_in_cache(cache_key, config, cached_at=saved_at, etag=etag)
+            loaded += 1
+            if self.shared_cache and time.time() - saved_at <= self.cache_ttl:
+                await self.shared_cache.put(cache_key, config, etag, saved_at)
+
+        self._metrics["snapshot_entries_loaded"] = loaded
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.info(f"Loaded {loaded} config snapshot(s) from {self.snapshot_store.path} ({duration_ms}ms)")
+
     async def _fetch_from_api(
         self,
         agent_id: str,
-        campaign_id: Optional[str] = None
-    ) -> Optional[AgentConfig]:
+        campaign_id: Optional[str] = None,
+        cached: Optional[CachedConfig] = None
+    ) -> Union[CachedConfig, _NotFound, None]:
         """
-        Fetch config from backend API
+        Fetch config from backend API through the circuit breaker
+
+        While the breaker is open this returns None immediately, so load()
+        falls through to stale/snapshot/default without waiting on a dead
+        backend. The request timeout adapts to observed backend latency.
 
         Args:
             agent_id: Agent ID
             campaign_id: Optional campaign ID for campaign-specific overrides
+            cached: Current (possibly expired) cache entry to revalidate
 
         Returns:
-            AgentConfig if successful, None otherwise
+            New cache entry if successful, NOT_FOUND if the backend says the
+            agent doesn't exist, None on other failures
+        """
+        return await self._call_backend(
+            lambda base_url, timeout: self._request_config(base_url, agent_id, campaign_id, cached, timeout),
+            f"API fetch for agent {agent_id}",
+            hedge=self.hedge_requests
+        )
+
+    async def _call_backend(
+        self,
+        request: Callable[[str, float], Awaitable[Optional[T]]],
+        description: str,
+        hedge: bool = False
+    ) -> Optional[T]:
+        """
+        Run a backend request through the circuit breaker and adaptive timeout
+
+        Used for every backend call, so an open breaker fails them all
+        fast. A None result counts as a failure.
+
+        Args:
+            request: Coroutine function taking the endpoint base URL and
+                the total timeout in seconds
+            description: What the request is, for the circuit-open log
+            hedge: Allow a hedged second request
+
+        Returns:
+            The request's result, None if it failed or the breaker is open
+        """
+        if not self._breaker.allow_request():
+            self._metrics["circuit_open_rejections"] += 1
+            logger.warning(f"Circuit open, skipping {description}")
+            return None
+
+        start_time = time.monotonic()
+        result = None
+        try:
+            # A half-open probe gets the full timeout: if the backend only
+            # got slower, the learned timeout would fail the probe too
+            if self._breaker.state == CircuitBreaker.HALF_OPEN:
+                timeout = self._timeout.max_timeout
+            else:
+                timeout = self._timeout.current()
+            result = await self.endpoints.request(lambda base_url: request(base_url, timeout), hedge=hedge)
+        finally:
+            if result is None:
+                self._breaker.record_failure()
+            else:
+                self._breaker.record_success()
+                self._timeout.record(time.monotonic() - start_time)
+
+        return result
+
+    async def _request_config(
+        self,
+        base_url: str,
+        agent_id: str,
+        campaign_id: Optional[str],
+        cached: Optional[CachedConfig],
+        timeout: float
+    ) -> Union[CachedConfig, _NotFound, None]:
+        """
+        Make one runtime-config request
+
+        If the current cache entry carries an ETag, the request is made
+        conditional; a 304 reuses the already-parsed config.
+
+        Args:
+            base_url: Backend endpoint to query
+            agent_id: Agent ID
+            campaign_id: Optional campaign ID for campaign-specific overrides
+            cached: Current (possibly expired) cache entry to revalidate
+            timeout: Total request timeout in seconds
+
+        Returns:
+            New cache entry if successful, NOT_FOUND if the backend says the
+            agent doesn't exist, None on other failures
         """
         await self._ensure_session()
 
         # Build URL
-        url = f"{self.backend_url}/api/v1/agents/{agent_id}/runtime-config"
+        url = f"{base_url}/api/v1/agents/{agent_id}/runtime-config"
         params = {}
         if campaign_id:
             params["campaignId"] = campaign_id
 
+        headers = {}
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+
+        cache_key = self._make_cache_key(agent_id, campaign_id)
+
         try:
             logger.debug(f"Fetching config from API: {url}")
-            async with self._session.get(url, params=params) as response:
+            async with self._session.get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                if response.status == 304 and cached:
+                    logger.info(f"Config not modified for agent {agent_id}, extending TTL")
+                    return CachedConfig(
+                        config=cached.config,
+                        cached_at=time.time(),
+                        cache_key=cache_key,
+                        ttl=self.cache_ttl,
+                        etag=cached.etag
+                    )
+
                 if response.status == 200:
-                    data = await response.json()
+                    # Validate the raw bytes directly (no intermediate dict)
+                    data = RuntimeConfigResponse.model_validate_json(await response.read())
 
-                    if not data.get("success"):
+                    if not data.success:
                         logger.warning(f"API returned success=false for agent {agent_id}")
-                        return None
+                        return NOT_FOUND
 
-                    config_data = data.get("config")
-                    if not config_data:
+                    if data.config is None:
                         logger.warning(f"API returned no config for agent {agent_id}")
-                        return None
+                        return NOT_FOUND
 
-                    # Parse into Pydantic model
-                    config = AgentConfig(**config_data)
                     logger.info(f"Successfully fetched config for agent {agent_id}")
-                    return config
+
+                    # Prefer the HTTP validator, fall back to a body version
+                    etag = response.headers.get("ETag")
+                    if not etag and data.version is not None:
+                        etag = f'"{data.version}"'
+
+                    return CachedConfig(
+                        config=data.config,
+                        cached_at=time.time(),
+                        cache_key=cache_key,
+                        ttl=self.cache_ttl,
+                        etag=etag
+                    )
 
                 elif response.status == 404:
                     logger.warning(f"Agent {agent_id} not found (404)")
-                    return None
+                    return NOT_FOUND
 
                 else:
                     text = await response.text()
@@ -185,7 +695,8 @@ class AgentConfigLoader:
                     return None
 
         except asyncio.TimeoutError:
-            logger.error(f"API request timeout for agent {agent_id}")
+            logger.error(f"API request timeout for agent {agent_id} ({timeout:.2f}s)")
+            self._timeout.record_timeout(timeout)
             return None
         except aiohttp.ClientError as e:
             logger.error(f"API client error for agent {agent_id}: {e}")
@@ -194,6 +705,205 @@ class AgentConfigLoader:
             logger.error(f"Unexpected error fetching config for agent {agent_id}: {e}")
             return None
 
+    async def _fetch_and_store(
+        self,
+        cache_key: str,
+        agent_id: str,
+        campaign_id: Optional[str] = None
+    ) -> Optional[AgentConfig]:
+        """
+        Fetch config from API and cache it on success
+
+        With a shared cache configured, a fresh entry written by another
+        process on this host is used instead, and the API fetch runs under
+        the host-wide lock for the key. Only shared entries newer than the
+        local one count, so early refreshes (refresh-ahead,
+        stale-while-revalidate) don't just read back the row they were
+        meant to replace.
+
+        Args:
+            cache_key: Cache key to store the result under
+            agent_id: Agent ID
+            campaign_id: Optional campaign ID
+
+        Returns:
+            AgentConfig if successful, None otherwise
+        """
+        if self.shared_cache is None or not self.shared_cache.available:
+            return await self._fetch_into_cache(cache_key, agent_id, campaign_id)
+
+        shared_config = await self._get_from_shared_cache(cache_key)
+        if shared_config:
+            return shared_config
+
+        async with self.shared_cache.fetch_lock(cache_key):
+            # Another process may have fetched it while we waited
+            shared_config = await self._get_from_shared_cache(cache_key)
+            if shared_config:
+                return shared_config
+
+            config = await self._fetch_into_cache(cache_key, agent_id, campaign_id)
+            entry = self._cache.peek(cache_key)
+            if config and entry is not None and entry.config is config:
+                await self.shared_cache.put(cache_key, config, entry.etag, entry.cached_at)
+            return config
+
+    async def _get_from_shared_cache(self, cache_key: str) -> Optional[AgentConfig]:
+        """Copy a fresh host-wide entry, newer than the local one, into the local cache"""
+        shared = await self.shared_cache.get(cache_key)
+        if shared is None:
+            return None
+
+        config, cached_at, etag = shared
+        if time.time() - cached_at > self.cache_ttl:
+            return None
+        local = self._cache.peek(cache_key)
+        if local is not None and cached_at <= local.cached_at:
+            return None
+        if asyncio.current_task() in self._superseded:
+            return None
+
+        self._metrics["shared_cache_hits"] += 1
+        self._put_in_cache(cache_key, config, cached_at=cached_at, etag=etag)
+        logger.debug(f"Shared cache hit for {cache_key}")
+        return config
+
+    def _remember_not_found(self, cache_key: str):
+        """Record in the negative cache that the backend doesn't know cache_key"""
+        if self.negative_cache_ttl <= 0:
+            return
+        evicted = self._negative.put(cache_key, time.time())
+        self._negative_index.add(cache_key)
+        for evicted_key, _ in evicted:
+            self._negative_index.remove(evicted_key)
+
+    async def _fetch_into_cache(
+        self,
+        cache_key: str,
+        agent_id: str,
+        campaign_id: Optional[str] = None
+    ) -> Optional[AgentConfig]:
+        """
+        Fetch config from API and store it in the local cache and snapshot
+
+        Returns:
+            AgentConfig if successful, None otherwise
+        """
+        cached = self._cache.peek(cache_key)
+        entry = await self._fetch_from_api(agent_id, campaign_id, cached)
+
+        if entry is NOT_FOUND:
+            self._metrics["api_failures"] += 1
+            self._metrics["api_not_found"] += 1
+            if asyncio.current_task() in self._superseded:
+                return None
+
+            # Deleted/disabled: never serve the old config again
+            self._remove_from_cache(cache_key)
+            if self.snapshot_store:
+                self.snapshot_store.delete(cache_key)
+            if self.shared_cache:
+                self.shared_cache.invalidate(agent_id, campaign_id)
+
+            self._remember_not_found(cache_key)
+            return None
+
+        if not entry:
+            self._metrics["api_failures"] += 1
+            return None
+
+        self._metrics["api_successes"] += 1
+
+        if asyncio.current_task() in self._superseded:
+            # Invalidated while in flight: serve to waiting callers, don't cache
+            return entry.config
+
+        self._put_in_cache(cache_key, entry.config, etag=entry.etag)
+
+        if cached is not None and entry.config is cached.config:
+            self._metrics["api_not_modified"] += 1
+        elif self.snapshot_store:
+            self.snapshot_store.save(cache_key, entry.config, entry.etag)
+
+        return entry.config
+
+    async def _fetch_coalesced(
+        self,
+        cache_key: str,
+        agent_id: str,
+        campaign_id: Optional[str] = None
+    ) -> Optional[AgentConfig]:
+        """
+        Fetch config from API, sharing one request between concurrent callers
+
+        The first caller for a cache key starts the fetch; everyone else
+        arriving while it is in flight awaits the same task.
+
+        Args:
+            cache_key: Cache key the fetch is deduplicated on
+            agent_id: Agent ID
+            campaign_id: Optional campaign ID
+
+        Returns:
+            AgentConfig if successful, None otherwise
+        """
+        return await self._single_flight(
+            cache_key,
+            lambda: self._fetch_and_store(cache_key, agent_id, campaign_id)
+        )
+
+    async def _single_flight(self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fetch() once per key, sharing the result with concurrent callers
+
+        Args:
+            key: Deduplication key
+            fetch: Coroutine factory, only called when no fetch is in flight
+
+        Returns:
+            Result of the shared fetch
+        """
+        task = self._inflight.get(key)
+        if task is not None and task not in self._superseded:
+            self._metrics["coalesced_requests"] += 1
+            logger.debug(f"Joining in-flight fetch for {key}")
+        else:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._inflight_done(key, t))
+
+        # Shield so one cancelled caller doesn't cancel the shared fetch
+        return await asyncio.shield(task)
+
+    def _inflight_done(self, cache_key: str, task: asyncio.Future):
+        """Drop a finished fetch from the in-flight table"""
+        self._superseded.discard(task)
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+
+    def _record_latency(self, source: str, outcome: str, start_time: float) -> int:
+        """
+        Record a load() latency in the histograms
+
+        Args:
+            source: Where the config came from (cache, stale, api, snapshot, default)
+            outcome: How it got there (hit, revalidate, success, fallback, not_found)
+            start_time: time.time() at the start of the load
+
+        Returns:
+            Duration in whole milliseconds, for ConfigFetchResult
+        """
+        elapsed_ms = (time.time() - start_time) * 1000
+        self._latency.record(elapsed_ms)
+
+        label = f"{source}/{outcome}"
+        histogram = self._latency_by_result.get(label)
+        if histogram is None:
+            histogram = self._latency_by_result[label] = LatencyHistogram()
+        histogram.record(elapsed_ms)
+
+        return int(elapsed_ms)
+
     async def load(
         self,
         agent_id: str,
@@ -202,11 +912,19 @@ class AgentConfigLoader:
         """
         Load agent configuration with fallback strategy
 
+        With campaign_overlays enabled, campaign loads resolve the agent's
+        base config through this same path and apply the campaign overlay.
+
         Fallback order:
-        1. Try cache (if fresh)
-        2. Try API
+        1. Try cache (if fresh, or within the stale-while-revalidate window)
+        2. Try API (skipped for keys in the negative cache)
         3. Use stale cache if API fails
-        4. Use default config
+        4. Use on-disk snapshot if configured
+        5. Use default config
+
+        Steps 3 and 4 are skipped for keys the backend reported as not
+        found (404 / success=false); their cached and snapshot copies are
+        dropped when that answer arrives.
 
         Args:
             agent_id: Agent ID
@@ -215,67 +933,538 @@ class AgentConfigLoader:
         Returns:
             ConfigFetchResult with config and metadata
         """
+        if self.campaign_overlays and campaign_id:
+            return await self._load_with_overlay(agent_id, campaign_id)
+
         start_time = time.time()
         self._metrics["total_requests"] += 1
 
         cache_key = self._make_cache_key(agent_id, campaign_id)
+        self._ensure_refresh_ahead()
+        self._record_access(cache_key)
 
         # Step 1: Check cache (fresh entries only)
         cached_config = self._get_from_cache(cache_key, ignore_ttl=False)
         if cached_config:
             self._metrics["cache_hits"] += 1
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = self._record_latency("cache", "hit", start_time)
             logger.info(f"Cache hit for {agent_id} (age: fresh, duration: {duration_ms}ms)")
             return ConfigFetchResult.success_from_cache(cached_config, duration_ms)
 
+        # Step 1b: Past soft TTL but within hard TTL - serve now, refresh behind
+        revalidatable_config = self._get_revalidatable(cache_key)
+        if revalidatable_config:
+            self._metrics["cache_hits"] += 1
+            self._metrics["stale_while_revalidate_hits"] += 1
+            self._refresh_in_background(cache_key, agent_id, campaign_id)
+            duration_ms = self._record_latency("stale", "revalidate", start_time)
+            logger.info(f"Cache hit for {agent_id} (age: stale, revalidating, duration: {duration_ms}ms)")
+            return ConfigFetchResult.success_from_cache(revalidatable_config, duration_ms)
+
         self._metrics["cache_misses"] += 1
 
-        # Step 2: Fetch from API
-        logger.info(f"Cache miss for {agent_id}, fetching from API...")
-        api_config = await self._fetch_from_api(agent_id, campaign_id)
+        # Step 2: Fetch from API (unless recently confirmed not to exist)
+        known_missing = self._negative.get(cache_key) is not None
+        if known_missing:
+            self._metrics["negative_hits"] += 1
+            logger.info(f"Negative cache hit for {agent_id}, skipping API")
+            api_config = None
+        else:
+            logger.info(f"Cache miss for {agent_id}, fetching from API...")
+            api_config = await self._fetch_coalesced(cache_key, agent_id, campaign_id)
 
         if api_config:
-            # Success! Cache it and return
-            self._put_in_cache(cache_key, api_config)
-            self._metrics["api_successes"] += 1
-            duration_ms = int((time.time() - start_time) * 1000)
+            # Success! (cached by the shared fetch)
+            duration_ms = self._record_latency("api", "success", start_time)
             logger.info(f"API fetch successful for {agent_id} (duration: {duration_ms}ms)")
             return ConfigFetchResult.success_from_api(api_config, duration_ms)
 
         # API failed...
-        self._metrics["api_failures"] += 1
+        # Steps 3-4 only cover outages: a deleted/disabled agent gets the default
+        not_found = known_missing or not self._negative.is_expired(cache_key)
 
         # Step 3: Try stale cache
-        stale_config = self._get_from_cache(cache_key, ignore_ttl=True)
+        stale_config = None if not_found else self._get_from_cache(cache_key, ignore_ttl=True)
         if stale_config:
             self._metrics["fallback_to_stale"] += 1
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = self._record_latency("stale", "fallback", start_time)
             logger.warning(f"API failed for {agent_id}, using stale cache (duration: {duration_ms}ms)")
             return ConfigFetchResult.success_from_cache(stale_config, duration_ms)
 
-        # Step 4: Fallback to default config
+        # Step 4: Try on-disk snapshot (entry may have been evicted from memory)
+        if self.snapshot_store and not not_found:
+            snapshot = await self.snapshot_store.get(cache_key)
+            if snapshot:
+                snapshot_config, _ = snapshot
+                self._metrics["fallback_to_snapshot"] += 1
+                duration_ms = self._record_latency("snapshot", "fallback", start_time)
+                logger.warning(f"API failed for {agent_id}, using snapshot (duration: {duration_ms}ms)")
+                return ConfigFetchResult.success_from_snapshot(snapshot_config, duration_ms)
+
+        # Step 5: Fallback to default config
         self._metrics["fallback_to_default"] += 1
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = self._record_latency("default", "not_found" if not_found else "fallback", start_time)
         default_config = AgentConfig.default()
         logger.error(f"No config available for {agent_id}, using default (duration: {duration_ms}ms)")
         return ConfigFetchResult.success_from_default(default_config, duration_ms)
 
-    async def preload(self, agent_ids: list[str]):
+    async def _load_with_overlay(self, agent_id: str, campaign_id: str) -> ConfigFetchResult:
+        """
+        Load base agent config and compose the campaign overlay on top
+
+        Args:
+            agent_id: Agent ID
+            campaign_id: Campaign ID
+
+        Returns:
+            ConfigFetchResult with the composed config
+        """
+        start_time = time.time()
+
+        base_result = await self.load(agent_id)
+        if base_result.source == "default":
+            return base_result
+
+        overlay = await self._get_overlay(agent_id, campaign_id, base_result.config)
+        if overlay is None and not self.campaign_overlays:
+            # Backend has no overlay endpoint; use the merged config path
+            return await self.load(agent_id, campaign_id)
+
+        config = None
+        if overlay is not None:
+            try:
+                config = overlay.compose(base_result.config)
+            except ValidationError as e:
+                logger.error(f"Overrides for campaign {campaign_id} don't apply to the current base of {agent_id}: {e}")
+
+        if config is None:
+            self._metrics["overlay_failures"] += 1
+            logger.warning(f"No overrides available for campaign {campaign_id}, using base config for {agent_id}")
+            return base_result
+
+        return ConfigFetchResult(
+            success=True,
+            config=config,
+            source=base_result.source,
+            duration_ms=int((time.time() - start_time) * 1000),
+            cache_hit=base_result.cache_hit
+        )
+
+    async def _get_overlay(self, agent_id: str, campaign_id: str, base: AgentConfig) -> Optional[CampaignOverlay]:
+        """
+        Get campaign overlay from cache or API
+
+        Serves expired overlays inside the stale-while-revalidate window (and
+        as a last resort when the API fails). Campaigns the backend recently
+        said don't exist are skipped via the negative cache.
+
+        Args:
+            agent_id: Agent ID
+            campaign_id: Campaign ID
+            base: Agent's current base config, to validate fetched overrides against
+
+        Returns:
+            CampaignOverlay, or None if unavailable
+        """
+        overlay_key = self._make_cache_key(agent_id, campaign_id)
+        fetch_key = OVERLAY_KEY_PREFIX + overlay_key
+
+        def fetch():
+            return self._single_flight(fetch_key, lambda: self._fetch_overlay_and_store(agent_id, campaign_id, base))
+
+        overlay = self._overlays.get(overlay_key)
+        if overlay is not None:
+            self._metrics["overlay_hits"] += 1
+            return overlay
+
+        stale = self._overlays.get(overlay_key, ignore_ttl=True)
+        if stale is not None and stale.age_seconds(time.time()) <= self.cache_ttl + self.stale_while_revalidate:
+            self._metrics["overlay_hits"] += 1
+            if fetch_key not in self._inflight:
+                task = asyncio.ensure_future(fetch())
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+            return stale
+
+        if self._negative.get(overlay_key) is not None:
+            self._metrics["negative_hits"] += 1
+            logger.info(f"Negative cache hit for campaign {campaign_id} of {agent_id}, skipping API")
+            return None
+
+        self._metrics["overlay_misses"] += 1
+        # Re-read: a not-found response drops the stale overlay too
+        return await fetch() or self._overlays.get(overlay_key, ignore_ttl=True)
+
+    async def _fetch_overlay_and_store(
+        self,
+        agent_id: str,
+        campaign_id: str,
+        base: AgentConfig
+    ) -> Optional[CampaignOverlay]:
+        """
+        Fetch campaign overrides from the best endpoint and cache them on success
+
+        Returns:
+            CampaignOverlay if successful, None otherwise
+        """
+        overlay = await self._call_backend(
+            lambda base_url, timeout: self._request_overlay(base_url, agent_id, campaign_id, base, timeout),
+            f"overlay fetch for campaign {campaign_id} of agent {agent_id}"
+        )
+        if overlay is NOT_FOUND:
+            if asyncio.current_task() in self._superseded:
+                return None
+            overlay_key = self._make_cache_key(agent_id, campaign_id)
+            if self._overlays.pop(overlay_key) is not None:
+                self._overlay_index.remove(overlay_key)
+            self._remember_not_found(overlay_key)
+            return None
+        return overlay
+
+    async def _request_overlay(
+        self,
+        base_url: str,
+        agent_id: str,
+        campaign_id: str,
+        base: AgentConfig,
+        timeout: float
+    ) -> Union[CampaignOverlay, _NotFound, None]:
+        """
+        Fetch campaign overrides from one endpoint and cache them on success
+
+        Turns campaign_overlays off if the backend doesn't have the
+        overlay endpoint (405, or a 404 without the API's JSON error body);
+        a 404 from the API itself only means this campaign is unknown.
+        Overrides are composed onto base before caching, so ones that don't
+        validate are never cached or served.
+
+        Returns:
+            CampaignOverlay if successful, NOT_FOUND if the backend says the
+            campaign doesn't exist, None on other failures
+        """
+        await self._ensure_session()
+
+        url = f"{base_url}/api/v1/agents/{agent_id}/runtime-config/overlay"
+        params = {"campaignId": campaign_id}
+        overlay_key = self._make_cache_key(agent_id, campaign_id)
+
+        try:
+            async with self._session.get(
+                url,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                if response.status in (404, 405):
+                    body = None
+                    if response.status == 404 and response.content_type == "application/json":
+                        body = await response.json()
+                    if not isinstance(body, dict) or "success" not in body:
+                        logger.warning("Backend has no campaign overlay endpoint, disabling campaign overlays")
+                        self.campaign_overlays = False
+                        return None
+
+                    logger.warning(f"Campaign {campaign_id} not found for agent {agent_id} (404)")
+                    return NOT_FOUND
+
+                if response.status != 200:
+                    text = await response.text()
+                    logger.error(f"Overlay API error ({response.status}): {text}")
+                    return None
+
+                data = await response.json()
+        except asyncio.TimeoutError:
+            logger.error(f"Overlay API request timeout for {overlay_key} ({timeout:.2f}s)")
+            self._timeout.record_timeout(timeout)
+            return None
+        except aiohttp.ClientError as e:
+            logger.error(f"Overlay API client error for {overlay_key}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error fetching overlay for {overlay_key}: {e}")
+            return None
+
+        if not isinstance(data, dict) or not data.get("success"):
+            logger.warning(f"Overlay API returned no overrides for {overlay_key}")
+            return None
+
+        overrides = data.get("overrides") or {}
+        if not isinstance(overrides, dict):
+            logger.error(f"Overlay API returned malformed overrides for {overlay_key}")
+            return None
+
+        overlay = CampaignOverlay(overrides=overrides, cached_at=time.time(), cache_key=overlay_key)
+        try:
+            overlay.compose(base)
+        except ValidationError as e:
+            logger.error(f"Overlay API returned invalid overrides for {overlay_key}: {e}")
+            return None
+
+        if asyncio.current_task() not in self._superseded:
+            evicted = self._overlays.put(overlay_key, overlay)
+            self._overlay_index.add(overlay_key)
+            for evicted_key, _ in evicted:
+                self._overlay_index.remove(evicted_key)
+
+        return overlay
+
+    async def preload(
+        self,
+        targets: List[Union[str, Tuple[str, Optional[str]]]],
+        max_concurrency: int = 10,
+        batch_size: int = 50
+    ) -> Dict[str, int]:
         """
         Preload configurations for multiple agents
 
-        Useful for warming up cache during worker startup
+        Useful for warming up cache during worker startup; with a shared
+        cache configured, preloaded configs are also written there for the
+        job processes on this host. Uses the batch
+        runtime-config endpoint when the backend supports it and falls back
+        to per-agent fetches, never running more than max_concurrency
+        requests at once. Keys that are already fresh are skipped.
+
+        Args:
+            targets: Agent IDs, or (agent_id, campaign_id) pairs
+            max_concurrency: Max in-flight backend requests
+            batch_size: Agents per batch request
+
+        Returns:
+            Summary with requested/loaded/batched/failed counts and duration_ms
+        """
+        start_time = time.time()
+        await self.load_snapshot()
+
+        pending: Dict[str, Tuple[str, Optional[str]]] = {}
+        overlay_targets: List[Tuple[str, str]] = []
+        for target in targets:
+            agent_id, campaign_id = (target, None) if isinstance(target, str) else target
+            if self.campaign_overlays and campaign_id:
+                # Base config is shared; the overlay is fetched separately
+                overlay_targets.append((agent_id, campaign_id))
+                campaign_id = None
+            cache_key = self._make_cache_key(agent_id, campaign_id)
+            if self._cache.is_expired(cache_key):
+                pending[cache_key] = (agent_id, campaign_id)
+
+        total = len(pending)
+        logger.info(
+            f"Preloading {total} agent configs ({len(targets) - total} already cached, "
+            f"concurrency={max_concurrency})..."
+        )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        done = 0
+
+        def report(count: int):
+            nonlocal done
+            done += count
+            logger.info(f"Preload progress: {done}/{total} ({int((time.time() - start_time) * 1000)}ms)")
+
+        # Batch endpoint first
+        batched = 0
+        if self._batch_supported and pending:
+            items = list(pending.items())
+            chunks = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+
+            async def run_batch(chunk):
+                async with semaphore:
+                    loaded = await self._fetch_batch(chunk)
+                for cache_key in loaded:
+                    pending.pop(cache_key, None)
+                report(len(loaded))
+                return len(loaded)
+
+            results = await asyncio.gather(*[run_batch(c) for c in chunks], return_exceptions=True)
+            batched = sum(r for r in results if isinstance(r, int))
+
+        # Per-agent fallback for whatever the batch didn't cover
+        async def run_single(cache_key, agent_id, campaign_id):
+            async with semaphore:
+                config = await self._fetch_coalesced(cache_key, agent_id, campaign_id)
+            report(1)
+            return config is not None
+
+        results = await asyncio.gather(
+            *[run_single(k, a, c) for k, (a, c) in pending.items()],
+            return_exceptions=True
+        )
+        single = sum(1 for r in results if r is True)
+
+        # Campaign overlays for the preloaded bases
+        async def run_overlay(agent_id, campaign_id):
+            base = self._get_from_cache(self._make_cache_key(agent_id), ignore_ttl=True)
+            if base is None:
+                return
+            async with semaphore:
+                await self._get_overlay(agent_id, campaign_id, base)
+
+        if overlay_targets:
+            await asyncio.gather(*[run_overlay(a, c) for a, c in overlay_targets], return_exceptions=True)
+            logger.info(f"Preloaded {len(overlay_targets)} campaign overlay(s)")
+
+        summary = {
+            "requested": len(targets),
+            "loaded": batched + single,
+            "batched": batched,
+            "failed": len(results) - single,
+            "duration_ms": int((time.time() - start_time) * 1000),
+        }
+        logger.info(
+            f"Preloaded {summary['loaded']}/{total} configs successfully "
+            f"({batched} via batch, {summary['failed']} failed, {summary['duration_ms']}ms)"
+        )
+        return summary
+
+    async def _fetch_batch(self, chunk: List[Tuple[str, Tuple[str, Optional[str]]]]) -> List[str]:
+        """
+        Fetch a chunk of configs from the best endpoint's batch API
+
+        Args:
+            chunk: (cache_key, (agent_id, campaign_id)) pairs
+
+        Returns:
+            Cache keys that were loaded and cached
+        """
+        loaded = await self._call_backend(
+            lambda base_url, timeout: self._request_batch(base_url, chunk, timeout),
+            f"batch fetch of {len(chunk)} config(s)"
+        )
+        return loaded or []
+
+    async def _request_batch(
+        self,
+        base_url: str,
+        chunk: List[Tuple[str, Tuple[str, Optional[str]]]],
+        timeout: float
+    ) -> Optional[List[str]]:
+        """
+        Fetch a chunk of configs from one endpoint's batch runtime-config API
+
+        Marks the endpoint unsupported on 404/405 so later preloads go
+        straight to per-agent fetches.
 
         Args:
-            agent_ids: List of agent IDs to preload
+            base_url: Backend endpoint to query
+            chunk: (cache_key, (agent_id, campaign_id)) pairs
+            timeout: Total request timeout in seconds
+
+        Returns:
+            Cache keys that were loaded and cached, None if the request failed
         """
-        logger.info(f"Preloading {len(agent_ids)} agent configs...")
+        await self._ensure_session()
+
+        url = f"{base_url}/api/v1/agents/runtime-config/batch"
+        body = {
+            "requests": [
+                {"agentId": agent_id, "campaignId": campaign_id}
+                for _, (agent_id, campaign_id) in chunk
+            ]
+        }
+
+        try:
+            async with self._session.post(
+                url,
+                json=body,
+                timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                if response.status in (404, 405):
+                    logger.info("Batch runtime-config endpoint not available, using per-agent fetches")
+                    self._batch_supported = False
+                    return []
+
+                if response.status != 200:
+                    text = await response.text()
+                    logger.error(f"Batch API error ({response.status}): {text}")
+                    return None
+
+                data = await response.json()
+        except asyncio.TimeoutError:
+            logger.error(f"Batch API request timeout ({len(chunk)} agents, {timeout:.2f}s)")
+            self._timeout.record_timeout(timeout)
+            return None
+        except aiohttp.ClientError as e:
+            logger.error(f"Batch API client error: {e}")
+            return None
+
+        if not data.get("success"):
+            logger.warning("Batch API returned success=false")
+            return None
 
-        tasks = [self.load(agent_id) for agent_id in agent_ids]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        loaded = []
+        for item in data.get("configs") or []:
+            cache_key = self._make_cache_key(item.get("agentId"), item.get("campaignId"))
+            try:
+                config = AgentConfig(**item["config"])
+            except Exception as e:
+                logger.warning(f"Skipping invalid batch config for {cache_key}: {e}")
+                continue
 
-        success_count = sum(1 for r in results if isinstance(r, ConfigFetchResult) and r.success)
-        logger.info(f"Preloaded {success_count}/{len(agent_ids)} configs successfully")
+            self._put_in_cache(cache_key, config, etag=item.get("etag"))
+            if self.snapshot_store:
+                self.snapshot_store.save(cache_key, config, item.get("etag"))
+            if self.shared_cache:
+                entry = self._cache.peek(cache_key)
+                await self.shared_cache.put(cache_key, config, item.get("etag"), entry.cached_at)
+            loaded.append(cache_key)
+
+        self._metrics["api_successes"] += len(loaded)
+        return loaded
+
+    async def fetch_preload_targets(self) -> List[Tuple[str, Optional[str]]]:
+        """
+        Ask the backend which agents/campaigns this worker should preload
+
+        Returns:
+            (agent_id, campaign_id) pairs, empty if unavailable
+        """
+        targets = await self._call_backend(self._request_preload_targets, "preload targets fetch")
+        return targets or []
+
+    async def _request_preload_targets(
+        self,
+        base_url: str,
+        timeout: float
+    ) -> Optional[List[Tuple[str, Optional[str]]]]:
+        """Fetch preload targets from one endpoint, None on failure"""
+        await self._ensure_session()
+
+        url = f"{base_url}/api/v1/agents/preload-targets"
+        try:
+            async with self._session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                if response.status != 200:
+                    logger.warning(f"Preload targets unavailable ({response.status})")
+                    return None
+                data = await response.json()
+        except asyncio.TimeoutError:
+            logger.warning(f"Preload targets request timeout ({timeout:.2f}s)")
+            self._timeout.record_timeout(timeout)
+            return None
+        except aiohttp.ClientError as e:
+            logger.warning(f"Could not fetch preload targets: {e}")
+            return None
+
+        return [
+            (t["agentId"], t.get("campaignId"))
+            for t in data.get("targets") or []
+            if t.get("agentId")
+        ]
+
+    def is_known_missing(self, agent_id: str, campaign_id: Optional[str] = None) -> bool:
+        """
+        Check the negative cache without touching the API
+
+        Args:
+            agent_id: Agent ID
+            campaign_id: Optional campaign ID
+
+        Returns:
+            True if the backend recently said the agent (or this
+            agent/campaign pair) doesn't exist
+        """
+        keys = [self._make_cache_key(agent_id)]
+        if campaign_id:
+            keys.append(self._make_cache_key(agent_id, campaign_id))
+        return any(not self._negative.is_expired(key) for key in keys)
 
     def get_metrics(self) -> Dict:
         """
@@ -300,23 +1489,183 @@ class AgentConfigLoader:
         else:
             metrics["api_success_rate"] = 0.0
 
+        # Share of cache checks that refresh-ahead turned from miss into hit
+        if total_cache_checks > 0:
+            metrics["refresh_ahead_hit_rate_gain"] = metrics["refresh_ahead_saved_misses"] / total_cache_checks
+        else:
+            metrics["refresh_ahead_hit_rate_gain"] = 0.0
+
+        metrics["circuit_breaker"] = self._breaker.to_dict()
+        metrics["api_timeout_s"] = round(self._timeout.current(), 3)
+        metrics["api_timeouts"] = self._timeout.timeouts
+        metrics["backend"] = self.endpoints.to_dict()
+
         metrics["cache_size"] = len(self._cache)
+        metrics["negative_cache_size"] = len(self._negative)
+        metrics["overlay_cache_size"] = len(self._overlays)
+        metrics["cache_evictions"] = self._cache.evictions
+
+        # Memory: budgeted bytes count a shared prompt blob once per entry
+        raw_bytes = sum(entry.raw_nbytes for _, entry in self._cache.items())
+        metrics["cache_bytes"] = self._cache.total_bytes
+        metrics["cache_raw_bytes"] = raw_bytes
+        metrics["compression_ratio"] = raw_bytes / self._cache.total_bytes if self._cache.total_bytes else 1.0
+        metrics["prompt_blobs"] = self._prompts.blob_stats()["blobs"]
+        metrics["prompt_decompressions"] = self._prompts.decompressions
+
+        metrics["load_latency"] = self._latency.to_dict()
+        metrics["load_latency_by_result"] = {
+            label: histogram.to_dict()
+            for label, histogram in sorted(self._latency_by_result.items())
+        }
 
         return metrics
 
     def clear_cache(self):
         """Clear all cached configs"""
         self._cache.clear()
+        self._index.clear()
+        self._overlays.clear()
+        self._overlay_index.clear()
+        self._negative.clear()
+        self._negative_index.clear()
+        self._refreshed_ahead.clear()
         logger.info("Cache cleared")
 
-    def clear_agent_cache(self, agent_id: str):
+    def clear_agent_cache(self, agent_id: str) -> int:
         """
         Clear cache for specific agent
 
         Args:
             agent_id: Agent ID to clear
+
+        Returns:
+            Number of entries removed
+        """
+        return self.invalidate(agent_id=agent_id)
+
+    def clear_campaign_cache(self, campaign_id: str) -> int:
+        """
+        Clear cache for every agent running in a campaign
+
+        Args:
+            campaign_id: Campaign ID to clear
+
+        Returns:
+            Number of entries removed
+        """
+        return self.invalidate(campaign_id=campaign_id)
+
+    def invalidate(
+        self,
+        agent_id: Optional[str] = None,
+        campaign_id: Optional[str] = None,
+        refresh: bool = False
+    ) -> int:
+        """
+        Drop cached configs affected by a backend change
+
+        Matches every key for agent_id, every key for campaign_id, or only
+        the agent_id:campaign_id key when both are given. Uses the
+        agent/campaign indexes, so only matching entries are touched.
+        Fetches already in flight for a matching key are not cached when
+        they complete, since they may carry the pre-change config.
+
+        Args:
+            agent_id: Changed agent (None = any)
+            campaign_id: Changed campaign (None = any)
+            refresh: Re-fetch evicted keys in the background right away
+
+        Returns:
+            Number of cache entries removed
+        """
+        if agent_id is None and campaign_id is None:
+            return 0
+
+        keys = self._index.select(agent_id, campaign_id)
+
+        def matches(cache_key: str) -> bool:
+            key_agent, _, key_campaign = cache_key.removeprefix(OVERLAY_KEY_PREFIX).partition(":")
+            if agent_id is not None and key_agent != agent_id:
+                return False
+            if campaign_id is not None and key_campaign != campaign_id:
+                return False
+            return True
+
+        for cache_key, task in self._inflight.items():
+            if matches(cache_key):
+                self._superseded.add(task)
+
+        if self.shared_cache:
+            # Queued ahead of any refresh below, so it can't read the old entry
+            self.shared_cache.invalidate(agent_id, campaign_id)
+
+        for cache_key in keys:
+            self._remove_from_cache(cache_key)
+
+        for negative_key in self._negative_index.select(agent_id, campaign_id):
+            self._negative.pop(negative_key)
+            self._negative_index.remove(negative_key)
+
+        overlay_keys = self._overlay_index.select(agent_id, campaign_id)
+        for overlay_key in overlay_keys:
+            self._overlays.pop(overlay_key)
+            self._overlay_index.remove(overlay_key)
+
+        removed = len(keys) + len(overlay_keys)
+        self._metrics["invalidations"] += removed
+        logger.info(
+            f"Invalidated {removed} cached config(s) "
+            f"(agent={agent_id}, campaign={campaign_id}, refresh={refresh})"
+        )
+
+        if refresh:
+            for cache_key in keys:
+                key_agent, _, key_campaign = cache_key.partition(":")
+                self._refresh_in_background(cache_key, key_agent, key_campaign or None)
+
+        return removed
+
+    def invalidate_all(self) -> int:
+        """
+        Drop every cached config, locally and in the shared cache
+
+        For when change events may have been missed, e.g. while the
+        invalidation stream was disconnected. Like invalidate(), fetches
+        already in flight are not cached when they complete.
+
+        Returns:
+            Number of cache entries removed
+        """
+        self._superseded.update(self._inflight.values())
+        if self.shared_cache:
+            self.shared_cache.clear()
+
+        removed = len(self._cache) + len(self._overlays)
+        self.clear_cache()
+        self._metrics["invalidations"] += removed
+        return removed
+
+    def invalidate_many(
+        self,
+        agent_ids: Optional[List[str]] = None,
+        campaign_ids: Optional[List[str]] = None,
+        refresh: bool = False
+    ) -> int:
+        """
+        Bulk invalidation for several agents and/or campaigns
+
+        Args:
+            agent_ids: Agents whose keys should be dropped
+            campaign_ids: Campaigns whose keys should be dropped
+            refresh: Re-fetch evicted keys in the background right away
+
+        Returns:
+            Number of cache entries removed
         """
-        keys_to_remove = [k for k in self._cache.keys() if k.startswith(agent_id)]
-        for key in keys_to_remove:
-            del self._cache[key]
-        logger.info(f"Cleared cache for agent {agent_id} ({len(keys_to_remove)} entries)")
+        removed = 0
+        for agent_id in agent_ids or []:
+            removed += self.invalidate(agent_id=agent_id, refresh=refresh)
+        for campaign_id in campaign_ids or []:
+            removed += self.invalidate(campaign_id=campaign_id, refresh=refresh)
+        return removed
@@ -0,0 +1,279 @@
+"""
+Backend Endpoint Selection
+
+Tracks latency and error rate per backend endpoint (e.g. regional replicas
+or a read-only config service) and routes each request to the fastest
+healthy one. Optionally hedges: if the first request hasn't answered
+within that endpoint's p95 latency, a second request is sent to the next
+best endpoint and whichever succeeds first wins.
+"""
+
+import asyncio
+import math
+import time
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar, Union
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def parse_backend_urls(value: Union[str, List[str]]) -> List[str]:
+    """
+    Parse backend URLs
+
+    Args:
+        value: Comma-separated URLs, or a list of URLs
+
+    Returns:
+        URLs without trailing slashes, in the given order
+    """
+    urls = value.split(",") if isinstance(value, str) else value
+    return [url.strip().rstrip("/") for url in urls if url and url.strip()]
+
+
+class BackendEndpoint:
+    """Live stats for one backend base URL"""
+
+    def __init__(self, url: str, window: int = 100):
+        self.url = url
+        self.latency_ewma: Optional[float] = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.last_used = 0.0
+        self._latencies: deque = deque(maxlen=window)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Latency percentile (0-1) over the recent window, None if no samples"""
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Endpoint stats for metrics"""
+        p95 = self.percentile(0.95)
+        return {
+            "url": self.url,
+            "latency_ewma_ms": round(self.latency_ewma * 1000, 1) if self.latency_ewma is not None else None,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "error_rate": round(self.error_rate, 3),
+            "requests": self.requests,
+            "failures": self.failures,
+        }
+
+
+class EndpointSelector:
+    """
+    Latency-aware selection over one or more backend endpoints
+
+    Endpoints with an EWMA error rate under max_error_rate are healthy; the
+    one with the lowest EWMA latency is chosen (endpoints without samples
+    yet go first, so every endpoint gets measured). Unhealthy endpoints get
+    a probe request again once probe_interval has passed since their last
+    use. If nothing is healthy, the endpoint with the lowest error rate is
+    used anyway.
+    """
+
+    def __init__(
+        self,
+        urls: Union[str, List[str]],
+        alpha: float = 0.2,
+        max_error_rate: float = 0.5,
+        probe_interval: float = 10.0,
+        hedge_quantile: float = 0.95,
+        min_hedge_samples: int = 20,
+        min_hedge_delay: float = 0.02,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize selector
+
+        Args:
+            urls: Comma-separated base URLs, or a list of them
+            alpha: EWMA smoothing factor for latency and error rate
+            max_error_rate: Error rate at or above which an endpoint is unhealthy
+            probe_interval: Seconds before an unhealthy endpoint is retried
+            hedge_quantile: Latency quantile used as the hedge delay
+            min_hedge_samples: Latency samples needed before hedging an endpoint
+            min_hedge_delay: Lower bound for the hedge delay in seconds
+            clock: Time source, in seconds
+        """
+        parsed = parse_backend_urls(urls)
+        if not parsed:
+            raise ValueError("At least one backend URL is required")
+
+        self.endpoints = [BackendEndpoint(url) for url in parsed]
+        self.alpha = alpha
+        self.max_error_rate = max_error_rate
+        self.probe_interval = probe_interval
+        self.hedge_quantile = hedge_quantile
+        self.min_hedge_samples = min_hedge_samples
+        self.min_hedge_delay = min_hedge_delay
+        self._clock = clock
+
+        # Stats
+        self.failovers = 0
+        self.hedged_requests = 0
+        self.hedge_wins = 0
+
+    @property
+    def primary(self) -> BackendEndpoint:
+        """First configured endpoint"""
+        return self.endpoints[0]
+
+    def _is_healthy(self, endpoint: BackendEndpoint, now: float) -> bool:
+        return (
+            endpoint.error_rate < self.max_error_rate
+            or now - endpoint.last_used >= self.probe_interval
+        )
+
+    def choose(self, exclude: Optional[BackendEndpoint] = None) -> BackendEndpoint:
+        """
+        Pick the endpoint for the next request
+
+        Args:
+            exclude: Endpoint to avoid (e.g. the one already tried), unless
+                it is the only one
+
+        Returns:
+            Selected endpoint
+        """
+        candidates = [e for e in self.endpoints if e is not exclude] or self.endpoints
+        now = self._clock()
+
+        healthy = [e for e in candidates if self._is_healthy(e, now)]
+        if not healthy:
+            return min(candidates, key=lambda e: e.error_rate)
+
+        return min(healthy, key=lambda e: e.latency_ewma if e.latency_ewma is not None else -1.0)
+
+    def record(self, endpoint: BackendEndpoint, latency_s: Optional[float], ok: Optional[bool]):
+        """
+        Update an endpoint's stats
+
+        Args:
+            endpoint: Endpoint the request went to
+            latency_s: Request latency, None if unknown
+            ok: Whether the request succeeded, None to update latency only
+                (e.g. a request cancelled after losing a hedge)
+        """
+        if latency_s is not None:
+            endpoint._latencies.append(latency_s)
+            if endpoint.latency_ewma is None:
+                endpoint.latency_ewma = latency_s
+            else:
+                endpoint.latency_ewma += self.alpha * (latency_s - endpoint.latency_ewma)
+
+        if ok is None:
+            return
+
+        endpoint.requests += 1
+        if not ok:
+            endpoint.failures += 1
+        endpoint.error_rate += self.alpha * ((0.0 if ok else 1.0) - endpoint.error_rate)
+
+    def hedge_delay(self, endpoint: BackendEndpoint) -> Optional[float]:
+        """Seconds to wait on an endpoint before hedging, None if too few samples"""
+        if len(endpoint._latencies) < self.min_hedge_samples:
+            return None
+        return max(self.min_hedge_delay, endpoint.percentile(self.hedge_quantile))
+
+    async def _attempt(
+        self,
+        endpoint: BackendEndpoint,
+        request: Callable[[str], Awaitable[T]],
+        is_success: Callable[[T], bool]
+    ) -> T:
+        """Run one request against an endpoint and record the outcome"""
+        endpoint.last_used = self._clock()
+        start_time = time.monotonic()
+        try:
+            result = await request(endpoint.url)
+        except asyncio.CancelledError:
+            self.record(endpoint, time.monotonic() - start_time, ok=None)
+            raise
+        except Exception:
+            self.record(endpoint, None, ok=False)
+            raise
+
+        ok = is_success(result)
+        self.record(endpoint, time.monotonic() - start_time if ok else None, ok=ok)
+        return result
+
+    async def request(
+        self,
+        request: Callable[[str], Awaitable[T]],
+        hedge: bool = False,
+        is_success: Callable[[T], bool] = lambda result: result is not None
+    ) -> T:
+        """
+        Run a request against the best endpoint
+
+        Without hedging the request runs inline in the calling task, and a
+        failure is retried once on the next best endpoint. With hedging, a
+        second request goes to the next best endpoint if the first is
+        slower than its p95 or fails; the first success wins and the other
+        request is cancelled.
+
+        Args:
+            request: Coroutine function taking the endpoint base URL
+            hedge: Allow a hedged second request
+            is_success: Whether a result counts as a success
+
+        Returns:
+            The winning result, or the last failed result if all failed
+        """
+        primary = self.choose()
+        delay = self.hedge_delay(primary) if hedge else None
+        if delay is None:
+            result = await self._attempt(primary, request, is_success)
+            if is_success(result) or len(self.endpoints) == 1:
+                return result
+
+            secondary = self.choose(exclude=primary)
+            logger.info(f"Request to {primary.url} failed, retrying on {secondary.url}")
+            self.failovers += 1
+            return await self._attempt(secondary, request, is_success)
+
+        first = asyncio.ensure_future(self._attempt(primary, request, is_success))
+        tasks = {first}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done and is_success(first.result()):
+                return first.result()
+
+            secondary = self.choose(exclude=primary)
+            self.hedged_requests += 1
+            logger.debug(f"Hedging request to {secondary.url} after {delay * 1000:.0f}ms")
+            second = asyncio.ensure_future(self._attempt(secondary, request, is_success))
+            tasks.add(second)
+
+            pending = tasks - done
+            result = first.result() if done else None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if is_success(result):
+                        if task is second:
+                            self.hedge_wins += 1
+                        return result
+            return result
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Selector stats for metrics"""
+        return {
+            "endpoints": [e.to_dict() for e in self.endpoints],
+            "failovers": self.failovers,
+            "hedged_requests": self.hedged_requests,
+            "hedge_wins": self.hedge_wins,
+        }
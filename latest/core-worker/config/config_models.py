@@ -1,11 +1,12 @@
 """
 Configuration models for Core Voice Worker
 
-Pydantic models for type-safe configuration management
+Pydantic models for type-safe configuration management. Cache entries and
+fetch results are plain slotted classes since they are built on every load.
 """
 
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from datetime import datetime
 
 
@@ -54,24 +55,27 @@ class AgentConfig(BaseModel):
     # Metadata
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional configuration data")
 
-    @validator('llm_provider')
-    def validate_llm_provider(cls, v):
+    @field_validator('llm_provider')
+    @classmethod
+    def validate_llm_provider(cls, v: str) -> str:
         """Validate LLM provider is supported"""
         valid_providers = ['openai', 'cerebras', 'groq', 'google', 'amazon']
         if v.lower() not in valid_providers:
             raise ValueError(f"LLM provider must be one of: {', '.join(valid_providers)}")
         return v.lower()
 
-    @validator('tts_provider')
-    def validate_tts_provider(cls, v):
+    @field_validator('tts_provider')
+    @classmethod
+    def validate_tts_provider(cls, v: str) -> str:
         """Validate TTS provider is supported"""
         valid_providers = ['cartesia', 'openai', 'elevenlabs', 'deepgram']
         if v.lower() not in valid_providers:
             raise ValueError(f"TTS provider must be one of: {', '.join(valid_providers)}")
         return v.lower()
 
-    @validator('stt_provider')
-    def validate_stt_provider(cls, v):
+    @field_validator('stt_provider')
+    @classmethod
+    def validate_stt_provider(cls, v: str) -> str:
         """Validate STT provider is supported"""
         valid_providers = ['assemblyai', 'deepgram', 'openai']
         if v.lower() not in valid_providers:
@@ -102,7 +106,7 @@ class AgentConfig(BaseModel):
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for logging/debugging"""
-        data = self.dict()
+        data = self.model_dump()
         # Redact sensitive fields
         for key in ['llm_api_key', 'tts_api_key', 'stt_api_key', 'livekit_api_key', 'livekit_api_secret']:
             if key in data and data[key]:
@@ -142,16 +146,56 @@ class RuntimeConfig(BaseModel):
         }
 
 
-class CachedConfig(BaseModel):
+class CachedConfig:
     """
     Cached configuration entry
 
-    Wraps AgentConfig with caching metadata
+    Wraps AgentConfig with caching metadata. The config may be held packed
+    (see prompt_store.PackedConfig) and is then unpacked on access.
     """
-    config: AgentConfig = Field(..., description="The agent configuration")
-    cached_at: float = Field(..., description="Unix timestamp when cached")
-    cache_key: str = Field(..., description="Cache key")
-    ttl: int = Field(default=300, description="Time-to-live in seconds")
+
+    __slots__ = ("_config", "cached_at", "cache_key", "ttl", "etag")
+
+    def __init__(
+        self,
+        config: Any,
+        cached_at: float,
+        cache_key: str,
+        ttl: int = 300,
+        etag: Optional[str] = None
+    ):
+        """
+        Args:
+            config: The agent configuration, or a PackedConfig
+            cached_at: Unix timestamp when cached
+            cache_key: Cache key
+            ttl: Time-to-live in seconds
+            etag: Backend ETag / config version for conditional refetch
+        """
+        self._config = config
+        self.cached_at = cached_at
+        self.cache_key = cache_key
+        self.ttl = ttl
+        self.etag = etag
+
+    def __repr__(self) -> str:
+        return f"CachedConfig(cache_key={self.cache_key!r}, cached_at={self.cached_at}, ttl={self.ttl}, etag={self.etag!r})"
+
+    @property
+    def config(self) -> AgentConfig:
+        """The agent configuration"""
+        config = self._config
+        return config if isinstance(config, AgentConfig) else config.unpack()
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the entry's config"""
+        return getattr(self._config, "nbytes", 0)
+
+    @property
+    def raw_nbytes(self) -> int:
+        """Approximate size of the config before compression"""
+        return getattr(self._config, "raw_nbytes", 0)
 
     def is_expired(self, current_time: float) -> bool:
         """Check if cache entry has expired"""
@@ -162,18 +206,88 @@ class CachedConfig(BaseModel):
         return current_time - self.cached_at
 
 
-class ConfigFetchResult(BaseModel):
+class CampaignOverlay(BaseModel):
+    """
+    Campaign-specific overrides applied on top of an agent's base config
+
+    Only the fields the campaign changes are stored; the composed config
+    is memoized per base config object so repeated reads are free until
+    the base is refreshed.
+    """
+    overrides: Dict[str, Any] = Field(default_factory=dict, description="AgentConfig fields overridden by the campaign")
+    cached_at: float = Field(..., description="Unix timestamp when cached")
+    cache_key: str = Field(..., description="Cache key (agent_id:campaign_id)")
+
+    _base: Optional[AgentConfig] = PrivateAttr(default=None)
+    _composed: Optional[AgentConfig] = PrivateAttr(default=None)
+
+    def compose(self, base: AgentConfig) -> AgentConfig:
+        """Apply overrides to a base config (validated, memoized per base)"""
+        if self._base is not base:
+            if self.overrides:
+                self._composed = AgentConfig(**{**base.model_dump(), **self.overrides})
+            else:
+                self._composed = base
+            self._base = base
+        return self._composed
+
+    def age_seconds(self, current_time: float) -> float:
+        """Get age of overlay in seconds"""
+        return current_time - self.cached_at
+
+
+class RuntimeConfigResponse(BaseModel):
+    """
+    Body of GET /api/v1/agents/{id}/runtime-config
+
+    Validated straight from the response bytes, so the config never goes
+    through an intermediate dict.
+    """
+    success: bool = Field(default=False, description="Whether the backend found the agent")
+    config: Optional[AgentConfig] = Field(None, description="The agent configuration")
+    version: Optional[Any] = Field(None, description="Config version, used as ETag if the header is missing")
+
+
+class ConfigFetchResult:
     """
     Result of a configuration fetch operation
 
     Tracks success/failure and provides metadata
     """
-    success: bool = Field(..., description="Whether fetch was successful")
-    config: Optional[AgentConfig] = Field(None, description="The fetched configuration")
-    error: Optional[str] = Field(None, description="Error message if failed")
-    source: str = Field(..., description="Source: api, cache, or default")
-    duration_ms: int = Field(..., description="How long the fetch took in milliseconds")
-    cache_hit: bool = Field(default=False, description="Whether this was a cache hit")
+
+    __slots__ = ("success", "config", "error", "source", "duration_ms", "cache_hit")
+
+    def __init__(
+        self,
+        success: bool,
+        source: str,
+        duration_ms: int,
+        config: Optional[AgentConfig] = None,
+        error: Optional[str] = None,
+        cache_hit: bool = False
+    ):
+        """
+        Args:
+            success: Whether fetch was successful
+            source: Source: api, cache, snapshot, default, or none
+            duration_ms: How long the fetch took in milliseconds
+            config: The fetched configuration
+            error: Error message if failed
+            cache_hit: Whether this was a cache hit
+        """
+        self.success = success
+        self.source = source
+        self.duration_ms = duration_ms
+        self.config = config
+        self.error = error
+        self.cache_hit = cache_hit
+
+    def __repr__(self) -> str:
+        agent_id = self.config.agent_id if self.config else None
+        return (
+            f"ConfigFetchResult(success={self.success}, source={self.source!r}, agent_id={agent_id!r}, "
+            f"duration_ms={self.duration_ms}, cache_hit={self.cache_hit}, error={self.error!r})"
+        )
 
     @classmethod
     def success_from_api(cls, config: AgentConfig, duration_ms: int) -> "ConfigFetchResult":
@@ -197,6 +311,17 @@ class ConfigFetchResult(BaseModel):
             cache_hit=True
         )
 
+    @classmethod
+    def success_from_snapshot(cls, config: AgentConfig, duration_ms: int) -> "ConfigFetchResult":
+        """Create successful result from on-disk snapshot"""
+        return cls(
+            success=True,
+            config=config,
+            source="snapshot",
+            duration_ms=duration_ms,
+            cache_hit=False
+        )
+
     @classmethod
     def success_from_default(cls, config: AgentConfig, duration_ms: int) -> "ConfigFetchResult":
         """Create successful result using default config"""
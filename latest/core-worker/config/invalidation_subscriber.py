@@ -0,0 +1,220 @@
+"""
+Config Invalidation Subscriber
+
+Listens to the backend's config change stream (Server-Sent Events) and
+evicts or refreshes affected cache entries as soon as an agent or campaign
+is edited, so the cache TTL can be long without serving stale prompts.
+"""
+
+import asyncio
+import json
+import random
+import logging
+from typing import Optional
+import aiohttp
+from .agent_config_loader import AgentConfigLoader
+
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigInvalidationSubscriber:
+    """
+    SSE subscriber that invalidates AgentConfigLoader entries
+
+    Expected event payload (one JSON object per SSE `data:` block):
+        {"type": "agent.updated", "agentId": "...", "campaignId": "..."}
+
+    `agentId` and/or `campaignId` select the keys to invalidate. Events of
+    type "*.deleted" only evict; all others also trigger a background
+    refresh. Reconnects with exponential backoff and full jitter.
+
+    A url starting with "/" is a path on the loader's backend endpoints:
+    each (re)connect goes to the currently best endpoint, so the stream
+    fails over along with config fetches.
+
+    Events sent while disconnected would otherwise be lost, so every
+    (re)connect resyncs: if the server has sent event IDs, the stream is
+    resumed with Last-Event-ID; if not, the whole cache (including the
+    shared cache) is dropped. Run one subscriber per host, in the
+    long-lived main worker process.
+    """
+
+    def __init__(
+        self,
+        loader: AgentConfigLoader,
+        url: str,
+        refresh: bool = True,
+        min_backoff: float = 1.0,
+        max_backoff: float = 60.0
+    ):
+        """
+        Initialize subscriber
+
+        Args:
+            loader: Config loader whose cache is invalidated
+            url: SSE endpoint URL, or a path on the loader's backend endpoints
+            refresh: Re-fetch invalidated keys in the background
+            min_backoff: Initial reconnect delay in seconds
+            max_backoff: Maximum reconnect delay in seconds
+        """
+        self.loader = loader
+        self.url = url
+        self.refresh = refresh
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+
+        self._task: Optional[asyncio.Task] = None
+        self._connected = False
+        self._first_connect = asyncio.Event()
+        self.last_event_id: Optional[str] = None
+
+        # Metrics
+        self.events_received = 0
+        self.reconnects = 0
+        self.resyncs = 0
+
+    @property
+    def connected(self) -> bool:
+        """Whether the event stream is currently open"""
+        return self._connected
+
+    def ensure_started(self):
+        """Start the subscriber on the running loop if not already running"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+            logger.info(f"Config invalidation subscriber started: {self.url}")
+
+    async def wait_connected(self, timeout: float) -> bool:
+        """
+        Wait for the first connection (and its resync)
+
+        Args:
+            timeout: Max seconds to wait
+
+        Returns:
+            True if connected within timeout
+        """
+        try:
+            await asyncio.wait_for(self._first_connect.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def stop(self):
+        """Stop the subscriber"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._connected = False
+
+    async def _run(self):
+        """Connect, consume, and reconnect forever with backoff"""
+        backoff = self.min_backoff
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=None)
+
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            while True:
+                try:
+                    received = await self._consume(session)
+                    if received:
+                        backoff = self.min_backoff
+                    logger.warning("Config invalidation stream closed by server")
+                except asyncio.CancelledError:
+                    raise
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.warning(f"Config invalidation stream error: {e}")
+                except Exception as e:
+                    logger.error(f"Unexpected error in config invalidation stream: {e}")
+                finally:
+                    self._connected = False
+
+                delay = random.uniform(0, backoff)
+                self.reconnects += 1
+                logger.info(f"Reconnecting to config invalidation stream in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                backoff = min(backoff * 2, self.max_backoff)
+
+    async def _consume(self, session: aiohttp.ClientSession) -> bool:
+        """
+        Read one SSE connection until it closes
+
+        Returns:
+            True if at least one event was handled
+        """
+        received = False
+        headers = {"Accept": "text/event-stream", "Cache-Control": "no-cache"}
+        if self.last_event_id is not None:
+            headers["Last-Event-ID"] = self.last_event_id
+
+        endpoint = None
+        url = self.url
+        if url.startswith("/"):
+            endpoint = self.loader.endpoints.choose()
+            url = f"{endpoint.url}{url}"
+
+        async with session.get(url, headers=headers) as response:
+            if response.status != 200:
+                if endpoint:
+                    self.loader.endpoints.record(endpoint, None, ok=False)
+                raise aiohttp.ClientResponseError(
+                    response.request_info,
+                    response.history,
+                    status=response.status,
+                    message="unexpected status from invalidation stream"
+                )
+
+            self._connected = True
+            self._resync()
+            self._first_connect.set()
+            logger.info(f"✓ Connected to config invalidation stream: {url}")
+
+            data_lines = []
+            event_id = None
+            async for raw_line in response.content:
+                line = raw_line.decode("utf-8").rstrip("\r\n")
+
+                if line.startswith("data:"):
+                    data_lines.append(line[5:].lstrip())
+                elif line.startswith("id:"):
+                    event_id = line[3:].lstrip()
+                elif line == "" and data_lines:
+                    self._handle_event("\n".join(data_lines))
+                    if event_id is not None:
+                        self.last_event_id = event_id
+                    data_lines = []
+                    event_id = None
+                    received = True
+                # Comments (":keepalive"), event: and retry: lines are ignored
+
+        return received
+
+    def _resync(self):
+        """Catch up on events that may have been missed while disconnected"""
+        if self.last_event_id is not None:
+            logger.info(f"Resuming config invalidation stream after event {self.last_event_id}")
+            return
+
+        removed = self.loader.invalidate_all()
+        self.resyncs += 1
+        logger.info(f"Config invalidation stream (re)connected, dropped {removed} cached config(s)")
+
+    def _handle_event(self, data: str):
+        """Apply one change event to the loader's cache"""
+        try:
+            event = json.loads(data)
+        except json.JSONDecodeError:
+            logger.warning(f"Ignoring malformed invalidation event: {data[:200]}")
+            return
+
+        self.events_received += 1
+        agent_id = event.get("agentId")
+        campaign_id = event.get("campaignId")
+        event_type = event.get("type", "")
+
+        if not agent_id and not campaign_id:
+            logger.debug(f"Ignoring invalidation event without target: {event_type}")
+            return
+
+        refresh = self.refresh and not event_type.endswith(".deleted")
+        self.loader.invalidate(agent_id=agent_id, campaign_id=campaign_id, refresh=refresh)
@@ -0,0 +1,137 @@
+"""
+Compact Prompt Storage
+
+System prompts and personalities dominate the size of a cached AgentConfig
+and range from a few hundred bytes to tens of kilobytes. PromptStore keeps
+large ones zlib-compressed and shared between agents with identical text;
+PackedConfig is the cache-resident form of an AgentConfig, decompressed on
+access and memoized for the hottest configs.
+"""
+
+import hashlib
+import sys
+import weakref
+import zlib
+from typing import Dict, Optional, Union
+from utils.lru_cache import LRUCache
+from .config_models import AgentConfig
+
+
+# AgentConfig fields that are stored compressed when large
+PROMPT_FIELDS = ("system_prompt", "personality")
+
+# Rough per-config overhead of the pydantic model and its small fields
+CONFIG_OVERHEAD_BYTES = 1024
+
+
+class _Blob:
+    """Compressed prompt text, shared by every config that uses it"""
+
+    __slots__ = ("data", "raw_size", "__weakref__")
+
+    def __init__(self, data: bytes, raw_size: int):
+        self.data = data
+        self.raw_size = raw_size
+
+
+class PromptStore:
+    """
+    Deduplicating, compressing store for prompt strings
+
+    Strings under compress_threshold bytes are interned; larger ones are
+    compressed once per distinct text and the blob is shared. Blobs are
+    held weakly, so they go away with the last config referencing them.
+    """
+
+    def __init__(self, compress_threshold: int = 1024, memo_size: int = 32, level: int = 6):
+        """
+        Initialize prompt store
+
+        Args:
+            compress_threshold: Min prompt size in bytes to compress (0 disables)
+            memo_size: Decompressed configs kept ready for immediate reuse
+            level: zlib compression level
+        """
+        self.compress_threshold = compress_threshold
+        self.level = level
+        self._blobs: "weakref.WeakValueDictionary[bytes, _Blob]" = weakref.WeakValueDictionary()
+        self._memo: LRUCache["PackedConfig", AgentConfig] = LRUCache(max_size=max(memo_size, 1))
+
+        # Stats
+        self.decompressions = 0
+
+    def _pack_text(self, text: Optional[str]) -> Union[str, _Blob, None]:
+        """Intern or compress one prompt string"""
+        if text is None:
+            return None
+
+        raw = text.encode("utf-8")
+        if not self.compress_threshold or len(raw) < self.compress_threshold:
+            return sys.intern(text)
+
+        digest = hashlib.sha1(raw).digest()
+        blob = self._blobs.get(digest)
+        if blob is None:
+            blob = _Blob(zlib.compress(raw, self.level), len(raw))
+            self._blobs[digest] = blob
+        return blob
+
+    def pack(self, config: AgentConfig) -> "PackedConfig":
+        """
+        Convert a config to its cache-resident form
+
+        The given config object stays the unpacked value for as long as
+        anyone holds it, so identity comparisons on it keep working.
+        """
+        fields = {name: self._pack_text(getattr(config, name)) for name in PROMPT_FIELDS}
+        compressed = {name: value for name, value in fields.items() if isinstance(value, _Blob)}
+
+        base = config.model_copy(update={
+            name: ("" if name in compressed else value) for name, value in fields.items()
+        })
+        packed = PackedConfig(self, base, compressed)
+        packed._ref = weakref.ref(config)
+        self._memo.put(packed, config)
+        return packed
+
+    def _unpack(self, packed: "PackedConfig") -> AgentConfig:
+        """Decompress a packed config (memoized)"""
+        config = packed._ref() if packed._ref is not None else None
+        if config is None:
+            self.decompressions += 1
+            config = packed.base.model_copy(update={
+                name: zlib.decompress(blob.data).decode("utf-8")
+                for name, blob in packed.compressed.items()
+            })
+            packed._ref = weakref.ref(config)
+        self._memo.put(packed, config)
+        return config
+
+    def blob_stats(self) -> Dict[str, int]:
+        """Raw and compressed size over distinct live blobs"""
+        blobs = list(self._blobs.values())
+        return {
+            "blobs": len(blobs),
+            "raw_bytes": sum(b.raw_size for b in blobs),
+            "stored_bytes": sum(len(b.data) for b in blobs),
+        }
+
+
+class PackedConfig:
+    """AgentConfig with large prompt fields held as shared compressed blobs"""
+
+    __slots__ = ("store", "base", "compressed", "nbytes", "raw_nbytes", "_ref", "__weakref__")
+
+    def __init__(self, store: PromptStore, base: AgentConfig, compressed: Dict[str, _Blob]):
+        self.store = store
+        self.base = base
+        self.compressed = compressed
+        self._ref: Optional["weakref.ReferenceType[AgentConfig]"] = None
+
+        small = sum(len(getattr(base, name) or "") for name in PROMPT_FIELDS)
+        self.nbytes = CONFIG_OVERHEAD_BYTES + small + sum(len(b.data) for b in compressed.values())
+        self.raw_nbytes = CONFIG_OVERHEAD_BYTES + small + sum(b.raw_size for b in compressed.values())
+
+    def unpack(self) -> AgentConfig:
+        """Full AgentConfig with prompts decompressed"""
+        return self.store._unpack(self)
@@ -0,0 +1,248 @@
+"""
+Host-wide Shared Config Cache
+
+LiveKit runs every job in its own worker process, so each process has its
+own cold in-memory cache. This cache sits behind the per-process LRU as a
+second level shared by all processes on the host: a SQLite file on tmpfs
+(/dev/shm by default) plus one advisory file lock per cache key, so a key
+is fetched from the backend once per host rather than once per process.
+"""
+
+import asyncio
+import fcntl
+import hashlib
+import os
+import sqlite3
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Tuple
+from .config_models import AgentConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+class SharedConfigCache:
+    """
+    Cross-process config cache for a single host
+
+    Reads and writes run on a background thread. fetch_lock() serializes
+    backend fetches for a key across processes; whoever holds the lock
+    writes the result before releasing it, so waiters find it on re-check.
+
+    If the database or lock directory can't be created (no /dev/shm on
+    macOS, read-only container filesystems), the cache turns itself off
+    for the process and callers fetch directly.
+
+    Note: entries include agent-specific API keys, so files are created
+    with owner-only permissions.
+    """
+
+    def __init__(self, path: str = "/dev/shm/core-worker-config.db", lock_timeout: float = 10.0):
+        """
+        Initialize shared cache
+
+        Args:
+            path: SQLite file path (tmpfs recommended)
+            lock_timeout: Max seconds to wait for another process's fetch
+        """
+        self.path = path
+        self.lock_dir = f"{path}.locks"
+        self.lock_timeout = lock_timeout
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="shared-config-cache")
+        self._conn: Optional[sqlite3.Connection] = None
+        self.available = True
+
+    def _disable(self, error: Exception):
+        """Turn the cache off for this process after a filesystem error"""
+        if self.available:
+            self.available = False
+            logger.warning(f"Shared config cache at {self.path} unavailable, disabled for this process: {error}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open database on the executor thread (lazily)"""
+        if self._conn is None:
+            try:
+                os.makedirs(self.lock_dir, mode=0o700, exist_ok=True)
+                fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+                os.close(fd)
+                conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            except (OSError, sqlite3.Error) as e:
+                self._disable(e)
+                raise
+
+            self._conn = conn
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=OFF")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS shared_configs ("
+                "cache_key TEXT PRIMARY KEY, "
+                "agent_id TEXT NOT NULL, "
+                "campaign_id TEXT, "
+                "config_json TEXT NOT NULL, "
+                "cached_at REAL NOT NULL, "
+                "etag TEXT)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_shared_agent ON shared_configs (agent_id)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_shared_campaign ON shared_configs (campaign_id)")
+            self._conn.commit()
+        return self._conn
+
+    def _read(self, cache_key: str) -> Optional[Tuple[AgentConfig, float, Optional[str]]]:
+        row = self._connect().execute(
+            "SELECT config_json, cached_at, etag FROM shared_configs WHERE cache_key = ?",
+            (cache_key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return AgentConfig.model_validate_json(row[0]), row[1], row[2]
+
+    def _write(self, cache_key: str, config: AgentConfig, cached_at: float, etag: Optional[str]):
+        agent_id, _, campaign_id = cache_key.partition(":")
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO shared_configs "
+            "(cache_key, agent_id, campaign_id, config_json, cached_at, etag) VALUES (?, ?, ?, ?, ?, ?)",
+            (cache_key, agent_id, campaign_id or None, config.model_dump_json(), cached_at, etag)
+        )
+        conn.commit()
+
+    def _delete(self, agent_id: Optional[str], campaign_id: Optional[str]) -> int:
+        clauses, params = [], []
+        if agent_id is not None:
+            clauses.append("agent_id = ?")
+            params.append(agent_id)
+        if campaign_id is not None:
+            clauses.append("campaign_id = ?")
+            params.append(campaign_id)
+        if not clauses:
+            return 0
+
+        conn = self._connect()
+        cursor = conn.execute(f"DELETE FROM shared_configs WHERE {' AND '.join(clauses)}", params)
+        conn.commit()
+        return cursor.rowcount
+
+    def _delete_all(self) -> int:
+        conn = self._connect()
+        cursor = conn.execute("DELETE FROM shared_configs")
+        conn.commit()
+        return cursor.rowcount
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    async def get(self, cache_key: str) -> Optional[Tuple[AgentConfig, float, Optional[str]]]:
+        """
+        Read an entry regardless of age
+
+        Returns:
+            (config, cached_at, etag) if present, None otherwise
+        """
+        if not self.available:
+            return None
+        try:
+            return await self._run(self._read, cache_key)
+        except Exception as e:
+            logger.warning(f"Shared config cache read failed for {cache_key}: {e}")
+            return None
+
+    async def put(
+        self,
+        cache_key: str,
+        config: AgentConfig,
+        etag: Optional[str] = None,
+        cached_at: Optional[float] = None
+    ):
+        """
+        Write an entry (awaited, so it is visible before the fetch lock is released)
+
+        Args:
+            cache_key: Cache key
+            config: Agent configuration
+            etag: Backend validator for conditional refetch
+            cached_at: When the config was fetched (default: now)
+        """
+        if not self.available:
+            return
+        try:
+            await self._run(self._write, cache_key, config, cached_at or time.time(), etag)
+        except Exception as e:
+            logger.warning(f"Shared config cache write failed for {cache_key}: {e}")
+
+    def invalidate(self, agent_id: Optional[str] = None, campaign_id: Optional[str] = None):
+        """
+        Queue deletion of entries for an agent, a campaign, or one pair
+
+        Runs on the same thread as reads, so any later get() sees it.
+        """
+        self._submit_delete(self._delete, agent_id, campaign_id)
+
+    def clear(self):
+        """
+        Queue deletion of every entry
+
+        For when change events may have been missed; like invalidate(),
+        any later get() sees it.
+        """
+        self._submit_delete(self._delete_all)
+
+    def _submit_delete(self, fn, *args):
+        if not self.available:
+            return
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(
+            lambda f: f.exception() and logger.warning(f"Shared config cache invalidation failed: {f.exception()}")
+        )
+
+    @asynccontextmanager
+    async def fetch_lock(self, cache_key: str) -> AsyncIterator[bool]:
+        """
+        Hold the host-wide fetch lock for a key
+
+        Polls a non-blocking flock so the event loop is never blocked.
+        Yields False (without the lock) if it can't be acquired within
+        lock_timeout, or if the lock file can't be created (which also
+        disables the cache), so callers fall back to fetching themselves.
+        """
+        if not self.available:
+            yield False
+            return
+
+        try:
+            os.makedirs(self.lock_dir, mode=0o700, exist_ok=True)
+            lock_name = hashlib.sha1(cache_key.encode("utf-8")).hexdigest()
+            fd = os.open(os.path.join(self.lock_dir, lock_name), os.O_RDWR | os.O_CREAT, 0o600)
+        except OSError as e:
+            self._disable(e)
+            yield False
+            return
+
+        acquired = False
+        deadline = time.monotonic() + self.lock_timeout
+        try:
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    acquired = True
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        logger.warning(f"Timed out waiting for shared fetch lock on {cache_key}")
+                        break
+                    await asyncio.sleep(0.02)
+
+            yield acquired
+        finally:
+            if acquired:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def close(self):
+        """Close the database"""
+        self._executor.shutdown(wait=True)
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,203 @@
+"""
+Config Snapshot Store
+
+Persists the last known good AgentConfig per cache key to a local SQLite
+file so worker restarts start warm and backend outages can still serve
+real agent configs instead of the default agent.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+from .config_models import AgentConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigSnapshotStore:
+    """
+    SQLite-backed snapshot of agent configs
+
+    All database access runs on a single background thread: reads are
+    awaited, writes are queued and coalesced so the event loop never
+    blocks on disk I/O.
+
+    Note: snapshots include agent-specific API keys, so the file is
+    created with owner-only permissions.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize snapshot store
+
+        Args:
+            path: SQLite database file path (created if missing)
+        """
+        self.path = path
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-snapshot")
+        self._conn: Optional[sqlite3.Connection] = None
+
+        # Writes waiting for the background thread: cache_key -> (config, saved_at, etag)
+        self._pending: Dict[str, Tuple[AgentConfig, float, Optional[str]]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open database on the executor thread (lazily)"""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            os.close(fd)
+
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS config_snapshots ("
+                "cache_key TEXT PRIMARY KEY, "
+                "config_json TEXT NOT NULL, "
+                "saved_at REAL NOT NULL, "
+                "etag TEXT)"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(config_snapshots)")}
+            if "etag" not in columns:
+                self._conn.execute("ALTER TABLE config_snapshots ADD COLUMN etag TEXT")
+            self._conn.commit()
+        return self._conn
+
+    def _read_all(self, limit: Optional[int] = None) -> Dict[str, Tuple[AgentConfig, float, Optional[str]]]:
+        """Read the newest snapshot rows, skipping ones that no longer validate"""
+        rows = self._connect().execute(
+            "SELECT cache_key, config_json, saved_at, etag FROM config_snapshots "
+            "ORDER BY saved_at DESC LIMIT ?",
+            (-1 if limit is None else limit,)
+        ).fetchall()
+
+        snapshots = {}
+        for cache_key, config_json, saved_at, etag in rows:
+            try:
+                snapshots[cache_key] = (AgentConfig.model_validate_json(config_json), saved_at, etag)
+            except Exception as e:
+                logger.warning(f"Skipping unreadable snapshot for {cache_key}: {e}")
+        return snapshots
+
+    def _read_one(self, cache_key: str) -> Optional[Tuple[AgentConfig, float]]:
+        """Read a single snapshot row"""
+        row = self._connect().execute(
+            "SELECT config_json, saved_at FROM config_snapshots WHERE cache_key = ?",
+            (cache_key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        try:
+            return AgentConfig.model_validate_json(row[0]), row[1]
+        except Exception as e:
+            logger.warning(f"Skipping unreadable snapshot for {cache_key}: {e}")
+            return None
+
+    def _flush(self):
+        """Write all pending snapshots in one transaction"""
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = {}
+            self._flush_scheduled = False
+
+        if not pending:
+            return
+
+        try:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO config_snapshots (cache_key, config_json, saved_at, etag) VALUES (?, ?, ?, ?)",
+                [
+                    (key, config.model_dump_json(), saved_at, etag)
+                    for key, (config, saved_at, etag) in pending.items()
+                ]
+            )
+            conn.commit()
+            logger.debug(f"Wrote {len(pending)} config snapshot(s)")
+        except Exception as e:
+            logger.error(f"Failed to write config snapshots: {e}")
+
+    async def load_all(self, limit: Optional[int] = None) -> Dict[str, Tuple[AgentConfig, float, Optional[str]]]:
+        """
+        Load all snapshots
+
+        Args:
+            limit: Only load the most recently saved rows (default: all)
+
+        Returns:
+            Mapping of cache key to (config, saved_at unix timestamp, etag)
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, self._read_all, limit)
+        except Exception as e:
+            logger.error(f"Failed to load config snapshots: {e}")
+            return {}
+
+    async def get(self, cache_key: str) -> Optional[Tuple[AgentConfig, float]]:
+        """
+        Load the snapshot for one cache key
+
+        Returns:
+            (config, saved_at) if present, None otherwise
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, self._read_one, cache_key)
+        except Exception as e:
+            logger.error(f"Failed to read config snapshot for {cache_key}: {e}")
+            return None
+
+    def save(self, cache_key: str, config: AgentConfig, etag: Optional[str] = None):
+        """
+        Queue a snapshot write (non-blocking)
+
+        Repeated saves for the same key before the next flush are coalesced.
+        """
+        with self._pending_lock:
+            self._pending[cache_key] = (config, time.time(), etag)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+
+        self._executor.submit(self._flush)
+
+    def delete(self, cache_key: str):
+        """
+        Queue removal of a snapshot (non-blocking)
+
+        Also drops a pending save for the key, so it can't be written back.
+        """
+        with self._pending_lock:
+            self._pending.pop(cache_key, None)
+
+        self._executor.submit(self._delete_one, cache_key)
+
+    def _delete_one(self, cache_key: str):
+        """Remove a single snapshot row"""
+        try:
+            conn = self._connect()
+            conn.execute("DELETE FROM config_snapshots WHERE cache_key = ?", (cache_key,))
+            conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to delete config snapshot for {cache_key}: {e}")
+
+    def close(self):
+        """Flush pending writes and close the database"""
+        self._executor.submit(self._flush)
+        self._executor.shutdown(wait=True)
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
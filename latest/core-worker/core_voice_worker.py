@@ -14,20 +14,41 @@ import os
 import sys
 import json
 import asyncio
+import resource
 import signal
-from typing import Optional
+import threading
+import time
+from typing import Any, Dict, Optional
 from dotenv import load_dotenv
 
 # LiveKit imports
 from livekit import agents
-from livekit.agents import Agent, AgentSession, JobContext
+from livekit.agents import Agent, AgentSession, JobContext, JobRequest
 from livekit.plugins import silero
 from livekit.plugins.turn_detector.multilingual import MultilingualModel
 
 # Core worker imports
-from config import AgentConfigLoader, AgentConfig
+from config import (
+    AgentConfigLoader,
+    AgentConfig,
+    ConfigSnapshotStore,
+    SharedConfigCache,
+    ConfigInvalidationSubscriber,
+)
 from factories import LLMFactory, TTSFactory, STTFactory
-from utils import setup_logger, get_logger, log_call_start, log_call_end, log_config_fetch, log_error
+from audio import GreetingAudioCache, PhraseAudioCache
+from utils import (
+    setup_logger,
+    get_logger,
+    log_call_start,
+    log_call_end,
+    log_call_latency,
+    log_config_load_latency,
+    log_config_fetch,
+    log_error,
+    LatencyHistogram,
+    TurnLatencyTracer,
+)
 
 # Load environment variables
 load_dotenv(".env.local")
@@ -39,9 +60,74 @@ LOG_FORMAT = os.getenv("LOG_FORMAT", "colored")  # "colored" or "json"
 logger = setup_logger("core-worker", LOG_LEVEL, LOG_FORMAT)
 
 # Initialize config loader (global instance)
-BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:3000")
+BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:3000")  # comma-separated for multiple endpoints
 CACHE_TTL = int(os.getenv("CONFIG_CACHE_TTL", "300"))  # 5 minutes
-config_loader = AgentConfigLoader(backend_url=BACKEND_URL, cache_ttl=CACHE_TTL)
+CACHE_SWR = int(os.getenv("CONFIG_CACHE_SWR", "0"))  # stale-while-revalidate window
+REFRESH_AHEAD_WINDOW = int(os.getenv("CONFIG_REFRESH_AHEAD_WINDOW", "0"))
+REFRESH_AHEAD_BUDGET = int(os.getenv("CONFIG_REFRESH_AHEAD_BUDGET", "5"))
+SNAPSHOT_PATH = os.getenv("CONFIG_SNAPSHOT_PATH", "")  # empty = disabled
+CAMPAIGN_OVERLAYS = os.getenv("CONFIG_CAMPAIGN_OVERLAYS", "false").lower() == "true"
+NEGATIVE_CACHE_TTL = int(os.getenv("CONFIG_NEGATIVE_CACHE_TTL", "30"))
+API_TIMEOUT = int(os.getenv("CONFIG_API_TIMEOUT", "5"))  # upper bound; adapts to backend p99
+CACHE_MAX_SIZE = int(os.getenv("CONFIG_CACHE_MAX_SIZE", "1000"))
+CACHE_MAX_BYTES = int(os.getenv("CONFIG_CACHE_MAX_MB", "32")) * 1024 * 1024  # 0 = entry count only
+PROMPT_COMPRESS_THRESHOLD = int(os.getenv("CONFIG_PROMPT_COMPRESS_THRESHOLD", "1024"))  # 0 = disabled
+BREAKER_THRESHOLD = int(os.getenv("CONFIG_BREAKER_THRESHOLD", "5"))
+BREAKER_RESET = float(os.getenv("CONFIG_BREAKER_RESET", "30"))
+HEDGE_REQUESTS = os.getenv("CONFIG_HEDGE_REQUESTS", "false").lower() == "true"
+SHARED_CACHE_PATH = os.getenv(
+    "CONFIG_SHARED_CACHE_PATH",
+    "/dev/shm/core-worker-config.db" if sys.platform.startswith("linux") else ""
+)  # empty = disabled (default outside Linux, which has no /dev/shm)
+PRELOAD_AGENTS = os.getenv("PRELOAD_AGENTS", "")  # "agent1,agent2:campaign1"
+PRELOAD_FROM_BACKEND = os.getenv("PRELOAD_FROM_BACKEND", "false").lower() == "true"
+PRELOAD_MAX_CONCURRENCY = int(os.getenv("PRELOAD_MAX_CONCURRENCY", "10"))
+REJECT_UNKNOWN_AGENTS = os.getenv("REJECT_UNKNOWN_AGENTS", "false").lower() == "true"
+TURN_DETECTOR_MAX_CONCURRENCY = int(os.getenv("TURN_DETECTOR_MAX_CONCURRENCY", "4"))
+
+# Pre-rendered greeting audio (memory + on-disk, shared across processes)
+GREETING_CACHE_ENABLED = os.getenv("GREETING_AUDIO_CACHE", "true").lower() == "true"
+GREETING_CACHE_DIR = os.getenv("GREETING_CACHE_DIR", "/tmp/core-worker-greetings")  # empty = memory only
+GREETING_CACHE_MAX_MB = int(os.getenv("GREETING_CACHE_MAX_MB", "256"))
+greeting_cache = GreetingAudioCache(
+    cache_dir=GREETING_CACHE_DIR or None,
+    max_disk_bytes=GREETING_CACHE_MAX_MB * 1024 * 1024
+) if GREETING_CACHE_ENABLED else None
+
+# Synthesized static phrases, replayed instead of calling the TTS provider
+PHRASE_CACHE_PHRASES = [p for p in os.getenv("TTS_PHRASE_CACHE_PHRASES", "").split("|") if p.strip()]  # empty = disabled
+PHRASE_CACHE_DIR = os.getenv("TTS_PHRASE_CACHE_DIR", "/tmp/core-worker-phrases")
+PHRASE_CACHE_MAX_MB = int(os.getenv("TTS_PHRASE_CACHE_MAX_MB", "64"))
+phrase_cache = PhraseAudioCache(
+    cache_dir=PHRASE_CACHE_DIR,
+    phrases=PHRASE_CACHE_PHRASES,
+    max_disk_bytes=PHRASE_CACHE_MAX_MB * 1024 * 1024
+) if PHRASE_CACHE_PHRASES and PHRASE_CACHE_DIR else None
+config_loader = AgentConfigLoader(
+    backend_url=BACKEND_URL,
+    cache_ttl=CACHE_TTL,
+    max_cache_size=CACHE_MAX_SIZE,
+    max_cache_bytes=CACHE_MAX_BYTES,
+    compress_threshold=PROMPT_COMPRESS_THRESHOLD,
+    request_timeout=API_TIMEOUT,
+    stale_while_revalidate=CACHE_SWR,
+    refresh_ahead_window=REFRESH_AHEAD_WINDOW,
+    refresh_ahead_budget=REFRESH_AHEAD_BUDGET,
+    snapshot_store=ConfigSnapshotStore(SNAPSHOT_PATH) if SNAPSHOT_PATH else None,
+    campaign_overlays=CAMPAIGN_OVERLAYS,
+    shared_cache=SharedConfigCache(SHARED_CACHE_PATH) if SHARED_CACHE_PATH else None,
+    negative_cache_ttl=NEGATIVE_CACHE_TTL,
+    breaker_failure_threshold=BREAKER_THRESHOLD,
+    breaker_reset_timeout=BREAKER_RESET,
+    hedge_requests=HEDGE_REQUESTS
+)
+
+# Push-based invalidation (SSE stream of agent/campaign change events),
+# consumed once per host by the main process (see start_host_services)
+INVALIDATION_URL = os.getenv("CONFIG_INVALIDATION_URL", "")  # empty = disabled
+invalidation_subscriber = (
+    ConfigInvalidationSubscriber(config_loader, INVALIDATION_URL) if INVALIDATION_URL else None
+)
 
 
 class DynamicVoiceAgent(Agent):
@@ -76,20 +162,128 @@ class DynamicVoiceAgent(Agent):
             extra={"agent_id": self.agent_id}
         )
 
+    async def tts_node(self, text, model_settings):
+        """Synthesize speech, replaying allowlisted static phrases from the phrase cache"""
+        if phrase_cache is None:
+            async for frame in Agent.default.tts_node(self, text, model_settings):
+                yield frame
+            return
+
+        async for frame in phrase_cache.synthesize(
+            self.config.tts_provider,
+            self.config.voice_id or self.config.tts_voice_id,
+            text,
+            lambda text_stream: Agent.default.tts_node(self, text_stream, model_settings)
+        ):
+            yield frame
+
+
+class TimedTurnDetector(MultilingualModel):
+    """
+    Multilingual turn detector shared by all sessions in a process
+
+    Inference already runs in LiveKit's inference executor, off the event
+    loop; this bounds how many predictions one process has in flight and
+    records per-turn inference latency.
+
+    Sharing and the bound only matter with the thread job executor, where
+    one process runs several sessions. With the default process executor
+    each job process runs a single call, so there is one detector per
+    call and the host-wide bound is the single inference process that
+    LiveKit shares between all job processes.
+    """
+
+    def __init__(self, max_concurrent: int = 4, **kwargs):
+        """
+        Initialize turn detector
+
+        Args:
+            max_concurrent: Max concurrent end-of-turn predictions
+            **kwargs: Passed to MultilingualModel
+        """
+        super().__init__(**kwargs)
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self.latency = LatencyHistogram()
+
+    async def predict_end_of_turn(self, chat_ctx, *, timeout: Optional[float] = 3) -> float:
+        async with self._semaphore:
+            start_time = time.perf_counter()
+            try:
+                return await super().predict_end_of_turn(chat_ctx, timeout=timeout)
+            finally:
+                self.latency.record((time.perf_counter() - start_time) * 1000)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident memory of this process in MB (ru_maxrss is KB on Linux)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
 
-async def prewarm_process(proc):
+def load_vad(userdata: Dict[str, Any]) -> Any:
     """
-    Prewarm worker process when it first starts
+    Get the process-wide Silero VAD, loading it on first use
+
+    Args:
+        userdata: JobProcess.userdata of this worker process
+
+    Returns:
+        Loaded VAD model
+    """
+    vad = userdata.get("vad")
+    if vad is not None:
+        return vad
+
+    start_time = time.time()
+    rss_before = peak_rss_mb()
+    vad = silero.VAD.load()
+    userdata["vad"] = vad
+    logger.info(
+        f"✅ VAD model loaded in {(time.time() - start_time) * 1000:.0f}ms "
+        f"(peak RSS +{peak_rss_mb() - rss_before:.1f} MB, now {peak_rss_mb():.0f} MB)"
+    )
+    return vad
+
+
+def load_turn_detector(userdata: Dict[str, Any]) -> TimedTurnDetector:
+    """
+    Get the process-wide turn detector, creating it on first use
+
+    Needs a job context (the detector binds to the job's inference
+    executor), so it is only called from entrypoint; prewarm_process
+    runs before the process has a job and would always get RuntimeError.
+
+    Args:
+        userdata: JobProcess.userdata of this worker process
+
+    Returns:
+        Shared turn detector
+    """
+    turn_detector = userdata.get("turn_detector")
+    if turn_detector is not None:
+        return turn_detector
+
+    start_time = time.time()
+    turn_detector = TimedTurnDetector(max_concurrent=TURN_DETECTOR_MAX_CONCURRENCY)
+    userdata["turn_detector"] = turn_detector
+    logger.info(f"✅ Turn detector initialized in {(time.time() - start_time) * 1000:.0f}ms")
+    return turn_detector
+
 
-    This is called once when the worker connects to LiveKit.
-    Preloading models here reduces cold start time for first calls.
+def prewarm_process(proc):
+    """
+    Prewarm a job process when it starts
+
+    Called synchronously by LiveKit in every new job process, before it
+    is handed a job. Preloading models here reduces cold start time for
+    calls; host-wide work runs once in the main process instead (see
+    start_host_services). The turn detector isn't created here: it needs
+    a job context, so entrypoint creates it (see load_turn_detector).
     """
     logger.info("🔥 Prewarming worker process...")
 
-    # Prewarm VAD model
+    # Prewarm VAD model (reused by every session in this process)
     try:
-        vad = silero.VAD.load()
-        logger.info("✅ VAD model preloaded")
+        load_vad(proc.userdata)
     except Exception as e:
         logger.error(f"⚠️  VAD prewarm failed: {e}")
 
@@ -102,19 +296,208 @@ async def prewarm_process(proc):
     else:
         logger.info("✅ Environment configuration verified")
 
-    # Test backend connectivity
+    logger.info("🎯 Worker process prewarmed and ready!")
+
+
+async def check_backend_health():
+    """Log whether each backend endpoint answers its health check"""
+    import aiohttp
+    async with aiohttp.ClientSession() as session:
+        for endpoint in config_loader.endpoints.endpoints:
+            try:
+                async with session.get(f"{endpoint.url}/health", timeout=aiohttp.ClientTimeout(total=5)) as response:
+                    if response.status == 200:
+                        logger.info(f"✅ Backend API reachable: {endpoint.url}")
+                    else:
+                        logger.warning(f"⚠️  Backend API {endpoint.url} returned {response.status}")
+            except Exception as e:
+                logger.warning(f"⚠️  Could not reach backend API {endpoint.url}: {e}")
+
+
+# Event loop of the main process's host services thread (see start_host_services)
+host_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def run_host_services():
+    """Backend health check, config change subscription, snapshot warm-up and config preload"""
+    await check_backend_health()
+
+    # Subscribe to config change events (the first connect drops entries
+    # a previous worker left in the shared cache, so preload after it)
+    if invalidation_subscriber:
+        invalidation_subscriber.ensure_started()
+        if not await invalidation_subscriber.wait_connected(timeout=10):
+            logger.warning("⚠️  Config invalidation stream not connected yet, preloading anyway")
+
+    # Warm from the on-disk snapshot once per host (job loaders only read
+    # single snapshot rows on their fallback path)
+    await config_loader.load_snapshot()
+
+    # Preload agent configs
+    await preload_agent_configs()
+
+
+async def stop_host_services():
+    """Stop the invalidation stream and close the main process's config loader"""
+    if invalidation_subscriber:
+        await invalidation_subscriber.stop()
+    await config_loader.close()
+
+
+def start_host_services():
+    """
+    Start host-wide services in the main worker process
+
+    Job processes live for one call each, so work meant to happen once
+    per host runs here instead, on a daemon thread with its own event
+    loop. The main process's config_loader is only used from that loop
+    (request_fnc hands its prefetches over to it).
+    """
+    global host_loop
+    host_loop = asyncio.new_event_loop()
+    threading.Thread(target=host_loop.run_forever, name="host-services", daemon=True).start()
+    asyncio.run_coroutine_threadsafe(run_host_services(), host_loop)
+
+
+def parse_preload_targets(value: str) -> list[tuple[str, Optional[str]]]:
+    """
+    Parse PRELOAD_AGENTS value
+
+    Args:
+        value: Comma-separated agent IDs, optionally as agent_id:campaign_id
+
+    Returns:
+        List of (agent_id, campaign_id) pairs
+    """
+    targets = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        agent_id, _, campaign_id = item.partition(":")
+        targets.append((agent_id, campaign_id or None))
+    return targets
+
+
+async def preload_agent_configs():
+    """
+    Warm the config cache from PRELOAD_AGENTS and/or the backend's preload list
+
+    Runs once per host in the main process; job processes only see the
+    result through the shared cache.
+    """
+    if not config_loader.shared_cache:
+        if PRELOAD_AGENTS or PRELOAD_FROM_BACKEND:
+            logger.warning("⚠️  Config preload needs CONFIG_SHARED_CACHE_PATH, skipping")
+        return
+
+    targets = parse_preload_targets(PRELOAD_AGENTS)
+    if PRELOAD_FROM_BACKEND:
+        targets += await config_loader.fetch_preload_targets()
+
+    if not targets:
+        return
+
     try:
-        import aiohttp
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{BACKEND_URL}/health", timeout=aiohttp.ClientTimeout(total=5)) as response:
-                if response.status == 200:
-                    logger.info(f"✅ Backend API reachable: {BACKEND_URL}")
-                else:
-                    logger.warning(f"⚠️  Backend API returned {response.status}")
+        summary = await config_loader.preload(targets, max_concurrency=PRELOAD_MAX_CONCURRENCY)
+        logger.info(
+            f"✅ Preloaded {summary['loaded']}/{summary['requested']} agent configs",
+            extra={"duration_ms": summary["duration_ms"]}
+        )
     except Exception as e:
-        logger.warning(f"⚠️  Could not reach backend API: {e}")
+        logger.warning(f"⚠️  Config preload failed: {e}")
+
+
+def parse_job_metadata(metadata: Optional[str]) -> Dict[str, Any]:
+    """
+    Parse job metadata JSON
+
+    Args:
+        metadata: Raw job metadata (may be empty)
+
+    Returns:
+        Metadata dict, empty if missing or invalid
+    """
+    if not metadata:
+        return {}
+    try:
+        data = json.loads(metadata)
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse job metadata: {e}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+async def prefetch_config(agent_id: str, campaign_id: Optional[str]):
+    """Load a config in the main process so the job process finds it in the shared cache"""
+    result = await config_loader.load(agent_id, campaign_id)
+    logger.debug(f"Prefetched config for {agent_id}: {result.source} ({result.duration_ms}ms)")
+
+
+async def request_fnc(req: JobRequest):
+    """
+    Decide on a job request and start its config fetch early
+
+    Runs in the main worker process before the job is assigned. The fetch
+    overlaps with job assignment and process handoff; its result reaches
+    the job process through the host-wide shared cache, so this only
+    prefetches when CONFIG_SHARED_CACHE_PATH is enabled. The fetch runs
+    on the host services loop, which owns the main process's loader.
 
-    logger.info("🎯 Worker prewarmed and ready!")
+    Args:
+        req: Incoming job request
+    """
+    metadata = parse_job_metadata(req.job.metadata)
+    agent_id = metadata.get("agent_id")
+    campaign_id = metadata.get("campaign_id")
+
+    if agent_id:
+        if REJECT_UNKNOWN_AGENTS and config_loader.is_known_missing(agent_id, campaign_id):
+            logger.warning(f"❌ Rejecting job for unknown/disabled agent {agent_id}")
+            await req.reject()
+            return
+
+        if config_loader.shared_cache and host_loop:
+            asyncio.run_coroutine_threadsafe(prefetch_config(agent_id, campaign_id), host_loop)
+
+    await req.accept()
+
+
+async def timed_step(timings: Dict[str, int], name: str, awaitable):
+    """Await a startup step and record its duration in ms under timings[name]"""
+    step_start = time.time()
+    try:
+        return await awaitable
+    finally:
+        timings[name] = int((time.time() - step_start) * 1000)
+
+
+async def play_greeting(session: AgentSession, config: AgentConfig, greeting: str):
+    """
+    Speak the greeting, from pre-rendered audio when available
+
+    On a cache miss the text is spoken through the session TTS as usual
+    and rendered for later calls in the background.
+    """
+    tts = session.tts
+    if greeting_cache is None or tts is None:
+        await session.say(greeting)
+        return
+
+    key = GreetingAudioCache.make_key(
+        config.agent_id,
+        config.tts_provider,
+        config.voice_id or config.tts_voice_id,
+        greeting
+    )
+    audio = await greeting_cache.get(key)
+    if audio is not None:
+        logger.info(f"🔊 Playing cached greeting ({audio.duration_ms}ms)")
+        await session.say(greeting, audio=audio.frames())
+        return
+
+    greeting_cache.render_in_background(key, tts, greeting)
+    await session.say(greeting)
 
 
 async def entrypoint(ctx: JobContext):
@@ -127,7 +510,6 @@ async def entrypoint(ctx: JobContext):
     Args:
         ctx: Job context from LiveKit containing room and metadata
     """
-    import time
     start_time = time.time()
 
     room_name = ctx.room.name
@@ -139,20 +521,17 @@ async def entrypoint(ctx: JobContext):
     phone_number: Optional[str] = None
     call_type: str = "unknown"
 
-    if ctx.job.metadata:
-        try:
-            metadata = json.loads(ctx.job.metadata)
-            agent_id = metadata.get("agent_id")
-            campaign_id = metadata.get("campaign_id")
-            phone_number = metadata.get("phone_number")
-            call_type = metadata.get("call_type", "unknown")
-
-            logger.info(
-                f"Extracted metadata: agent_id={agent_id}, campaign_id={campaign_id}, call_type={call_type}",
-                extra={"agent_id": agent_id, "campaign_id": campaign_id, "room_name": room_name}
-            )
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse job metadata: {e}")
+    metadata = parse_job_metadata(ctx.job.metadata)
+    if metadata:
+        agent_id = metadata.get("agent_id")
+        campaign_id = metadata.get("campaign_id")
+        phone_number = metadata.get("phone_number")
+        call_type = metadata.get("call_type", "unknown")
+
+        logger.info(
+            f"Extracted metadata: agent_id={agent_id}, campaign_id={campaign_id}, call_type={call_type}",
+            extra={"agent_id": agent_id, "campaign_id": campaign_id, "room_name": room_name}
+        )
 
     if not agent_id:
         logger.error("❌ No agent_id in metadata! Cannot proceed.")
@@ -160,13 +539,25 @@ async def entrypoint(ctx: JobContext):
         agent_id = "default"
         logger.warning("Using default agent configuration as fallback")
 
+    # Per-step startup timings for this call (ms)
+    timings: Dict[str, int] = {}
+
+    # Per-turn STT -> LLM -> TTS stage latencies for this call
+    turn_latency = TurnLatencyTracer()
+
     try:
         # ===================================================================
-        # STEP 1: Fetch Agent Configuration
+        # STEP 1: Fetch Agent Configuration + Connect to Room (concurrently)
         # ===================================================================
-        logger.info(f"🔍 Fetching configuration for agent: {agent_id}")
+        logger.info(f"🔍 Fetching configuration for agent {agent_id} while connecting to room")
 
-        config_result = await config_loader.load(agent_id, campaign_id)
+        connect_start = time.time()
+        config_result, _ = await asyncio.gather(
+            timed_step(timings, "config", config_loader.load(agent_id, campaign_id)),
+            timed_step(timings, "connect", ctx.connect()),
+        )
+        turn_latency.mark_connected(connect_start + timings["connect"] / 1000)
+        logger.info("✓ Connected to room")
 
         log_config_fetch(
             logger,
@@ -178,6 +569,7 @@ async def entrypoint(ctx: JobContext):
 
         if not config_result.success or not config_result.config:
             logger.error(f"❌ Failed to load config for agent {agent_id}")
+            ctx.shutdown(reason="agent config unavailable")
             return
 
         config = config_result.config
@@ -195,6 +587,7 @@ async def entrypoint(ctx: JobContext):
         # STEP 2: Initialize Components (STT/LLM/TTS)
         # ===================================================================
         logger.info("🛠️  Initializing voice pipeline components...")
+        components_start = time.time()
 
         # Create LLM
         try:
@@ -225,6 +618,9 @@ async def entrypoint(ctx: JobContext):
             tts_spec = "cartesia/sonic-2:79a125e8-cd45-4c13-8a67-188112f4dd22"
             logger.warning(f"Using fallback TTS: {tts_spec}")
 
+        # Open the TTS connection while the rest of the session is set up
+        tts = TTSFactory.prewarm(tts_spec)
+
         # Create STT
         try:
             stt_spec = STTFactory.create(
@@ -239,19 +635,24 @@ async def entrypoint(ctx: JobContext):
             stt_spec = "assemblyai/universal-streaming:en"
             logger.warning(f"Using fallback STT: {stt_spec}")
 
-        # ===================================================================
-        # STEP 3: Connect to Room
-        # ===================================================================
-        await ctx.connect()
-        logger.info("✓ Connected to room")
+        timings["components"] = int((time.time() - components_start) * 1000)
 
         log_call_start(logger, agent_id, room_name, call_type)
 
         # ===================================================================
-        # STEP 4: Create Agent Session
+        # STEP 3: Create Agent Session
         # ===================================================================
         logger.info("🎙️  Creating agent session...")
 
+        models_start = time.time()
+        vad = load_vad(ctx.proc.userdata)
+        turn_detector = load_turn_detector(ctx.proc.userdata)
+        timings["models"] = int((time.time() - models_start) * 1000)
+        logger.info(
+            f"✓ Models ready in {timings['models']}ms "
+            f"(process peak RSS {peak_rss_mb():.0f} MB)"
+        )
+
         session = AgentSession(
             # Speech-to-Text
             stt=stt_spec,
@@ -260,40 +661,82 @@ async def entrypoint(ctx: JobContext):
             llm=llm_spec,
 
             # Text-to-Speech
-            tts=tts_spec,
+            tts=tts,
 
             # Voice Activity Detection
-            vad=silero.VAD.load(),
+            vad=vad,
 
             # Turn detection for natural conversation flow
-            turn_detection=MultilingualModel(),
+            turn_detection=turn_detector,
         )
+        turn_latency.attach(session)
+
+        async def log_turn_latency():
+            log_call_latency(logger, agent_id, room_name, turn_latency.summary())
+
+        ctx.add_shutdown_callback(log_turn_latency)
+
+        # Config loads happen in this job process, not the main one
+        async def log_config_latency():
+            metrics = config_loader.get_metrics()
+            if metrics["load_latency"]["count"]:
+                log_config_load_latency(logger, agent_id, room_name, metrics)
+
+        ctx.add_shutdown_callback(log_config_latency)
+
+        async def log_turn_detector_latency():
+            stats = turn_detector.latency.to_dict()
+            if stats["count"]:
+                logger.info(
+                    f"Turn detector: {stats['count']} predictions in this process, "
+                    f"p50 {stats['p50_ms']}ms, p95 {stats['p95_ms']}ms, p99 {stats['p99_ms']}ms"
+                )
+
+        ctx.add_shutdown_callback(log_turn_detector_latency)
+
+        if phrase_cache is not None:
+            async def log_phrase_cache():
+                stats = phrase_cache.get_metrics()
+                if stats["hits"] or stats["misses"]:
+                    logger.info(
+                        f"🔁 TTS phrase cache: {stats['hits']} hits / {stats['misses']} misses in this process "
+                        f"(hit rate {stats['hit_rate']:.1%}), {stats['saved_synthesis_ms']}ms synthesis saved",
+                        extra={"phrase_cache": stats}
+                    )
+
+            ctx.add_shutdown_callback(log_phrase_cache)
 
         # Create dynamic agent with fetched configuration
         agent = DynamicVoiceAgent(config)
 
         # ===================================================================
-        # STEP 5: Start Session
+        # STEP 4: Start Session
         # ===================================================================
         logger.info("🚀 Starting agent session...")
 
-        await session.start(
+        await timed_step(timings, "session_start", session.start(
             room=ctx.room,
             agent=agent
-        )
+        ))
 
         # ===================================================================
-        # STEP 6: Handle Call Based on Type
+        # STEP 5: Handle Call Based on Type
         # ===================================================================
         if call_type == "inbound" or not phone_number:
             # Inbound call - greet the caller
             logger.info("📞 Inbound call - greeting caller")
             greeting = f"Hello! This is {config.name}. How can I help you today?"
-            await session.generate_reply(greeting)
+            await timed_step(timings, "greeting", play_greeting(session, config, greeting))
         else:
             # Outbound call - wait for user to speak
             logger.info(f"📞 Outbound call to {phone_number} - waiting for response")
 
+        timings["total"] = int((time.time() - start_time) * 1000)
+        logger.info(
+            "⏱️  Startup timings: " + ", ".join(f"{step}={ms}ms" for step, ms in timings.items()),
+            extra={"agent_id": agent_id, "room_name": room_name, "startup_timings_ms": timings}
+        )
+
         logger.info("✅ Agent session started successfully")
 
         # Session runs until call ends (handled by LiveKit)
@@ -331,10 +774,18 @@ def print_banner():
     print(banner)
     print(f"Version: 1.0.0")
     print(f"Backend URL: {BACKEND_URL}")
+    print(f"Hedged Config Requests: {'enabled' if HEDGE_REQUESTS else 'disabled'}")
     print(f"LiveKit URL: {os.getenv('LIVEKIT_URL', 'NOT SET')}")
     print(f"Worker Name: {os.getenv('WORKER_NAME', 'core-voice-worker')}")
     print(f"Max Concurrency: {os.getenv('MAX_CONCURRENCY', '25')}")
-    print(f"Cache TTL: {CACHE_TTL}s")
+    print(f"Cache TTL: {CACHE_TTL}s (stale-while-revalidate: {CACHE_SWR}s)")
+    print(f"Cache Budget: {CACHE_MAX_SIZE} entries, {CACHE_MAX_BYTES // (1024 * 1024) or 'unlimited'} MB")
+    print(f"Config Snapshot: {SNAPSHOT_PATH or 'disabled'}")
+    print(f"Shared Config Cache: {SHARED_CACHE_PATH or 'disabled'}")
+    print(f"Config Invalidation: {INVALIDATION_URL or 'disabled'}")
+    print(f"Greeting Audio Cache: {(GREETING_CACHE_DIR or 'memory only') if GREETING_CACHE_ENABLED else 'disabled'}")
+    print(f"TTS Phrase Cache: {f'{len(phrase_cache.phrases)} phrases in {PHRASE_CACHE_DIR}' if phrase_cache else 'disabled'}")
+    print(f"Job-Request Prefetch: {'enabled' if SHARED_CACHE_PATH else 'disabled (needs shared cache)'}")
     print(f"Log Level: {LOG_LEVEL}")
     print("=" * 66)
 
@@ -344,16 +795,52 @@ async def shutdown_handler(sig):
     logger.info(f"\n🛑 Received shutdown signal: {sig}")
     logger.info("Cleaning up...")
 
-    # Close config loader
-    await config_loader.close()
+    # Stop invalidation stream and close config loader (on the loop they run on)
+    if host_loop:
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(stop_host_services(), host_loop))
 
     # Print final metrics
     metrics = config_loader.get_metrics()
     logger.info("📊 Final Metrics:")
     logger.info(f"  Total requests: {metrics['total_requests']}")
     logger.info(f"  Cache hits: {metrics['cache_hits']} ({metrics['cache_hit_rate']:.1%})")
+    # Call-path load latency is logged per job (log_config_load_latency);
+    # this process only loads configs to prefetch them
+    latency = metrics["load_latency"]
+    if latency["count"]:
+        logger.info(
+            f"  Prefetch load latency: p50 {latency['p50_ms']}ms, p95 {latency['p95_ms']}ms, "
+            f"p99 {latency['p99_ms']}ms (max {latency['max_ms']}ms)"
+        )
+    logger.info(
+        f"  Cache memory: {metrics['cache_bytes'] / 1024:.0f} KB for {metrics['cache_size']} configs "
+        f"(compression {metrics['compression_ratio']:.1f}x)"
+    )
+    logger.info(f"  Coalesced requests: {metrics['coalesced_requests']}")
+    logger.info(f"  Shared cache hits: {metrics['shared_cache_hits']}")
+    logger.info(f"  Invalidations: {metrics['invalidations']}")
+    logger.info(f"  Negative cache hits: {metrics['negative_hits']}")
+    logger.info(
+        f"  Refresh-ahead: {metrics['refresh_ahead_fetches']} fetches, "
+        f"hit rate gain {metrics['refresh_ahead_hit_rate_gain']:.1%}"
+    )
     logger.info(f"  API calls: {metrics['api_successes'] + metrics['api_failures']}")
     logger.info(f"  API success rate: {metrics['api_success_rate']:.1%}")
+    logger.info(
+        f"  Circuit breaker: {metrics['circuit_breaker']['state']} "
+        f"(opened {metrics['circuit_breaker']['times_opened']}x, "
+        f"{metrics['circuit_open_rejections']} fast-fails)"
+    )
+    for endpoint in metrics["backend"]["endpoints"]:
+        logger.info(
+            f"  Backend {endpoint['url']}: {endpoint['requests']} requests, "
+            f"EWMA {endpoint['latency_ewma_ms']}ms, error rate {endpoint['error_rate']:.1%}"
+        )
+    if HEDGE_REQUESTS:
+        logger.info(
+            f"  Hedged requests: {metrics['backend']['hedged_requests']} "
+            f"({metrics['backend']['hedge_wins']} won by the hedge)"
+        )
 
     logger.info("👋 Core worker stopped gracefully")
 
@@ -383,11 +870,14 @@ def main():
             lambda s=sig: asyncio.create_task(shutdown_handler(s))
         )
 
+    start_host_services()
+
     try:
         # Run the worker
         agents.cli.run_app(
             agents.WorkerOptions(
                 entrypoint_fnc=entrypoint,
+                request_fnc=request_fnc,
                 prewarm_fnc=prewarm_process,
                 agent_name=os.getenv("WORKER_NAME", "core-voice-worker"),
                 api_key=os.getenv("LIVEKIT_API_KEY"),
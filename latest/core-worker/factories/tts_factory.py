@@ -6,7 +6,7 @@ Supports: Cartesia, OpenAI TTS, ElevenLabs, Deepgram Aura
 
 import os
 import logging
-from typing import Optional
+from typing import Any, Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +87,31 @@ class TTSFactory:
                 f"Supported: cartesia, openai, elevenlabs, deepgram"
             )
 
+    @staticmethod
+    def prewarm(spec: str) -> Union[str, Any]:
+        """
+        Build the TTS for a model string and open its connection right away
+
+        AgentSession otherwise connects when the agent first speaks, which
+        adds the handshake to the first response.
+
+        Args:
+            spec: TTS string in LiveKit format
+
+        Returns:
+            Connecting TTS instance, or spec unchanged if LiveKit inference
+            isn't available (AgentSession resolves it as before)
+        """
+        try:
+            from livekit.agents.inference import TTS
+        except ImportError:
+            return spec
+
+        # Same conversion AgentSession applies to model strings
+        tts = TTS.from_model_string(spec)
+        tts.prewarm()
+        return tts
+
     @classmethod
     def _create_cartesia(
         cls,
@@ -0,0 +1,48 @@
+"""
+Micro-benchmark for utils.lru_cache
+
+Measures put (at capacity, so every put evicts) and get per operation
+for 1k, 10k and 100k entries. Per-op cost should stay flat as the cache
+grows; the old min()-scan eviction grew linearly with size.
+
+Usage:
+    python tests/bench_lru_cache.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.lru_cache import LRUCache  # noqa: E402
+
+
+def bench(size: int, ops: int = 100_000):
+    cache = LRUCache(max_size=size, ttl=300)
+    for i in range(size):
+        cache.put(i, i)
+
+    start = time.perf_counter()
+    for i in range(size, size + ops):
+        cache.put(i, i)
+    put_ns = (time.perf_counter() - start) / ops * 1e9
+
+    newest = size + ops
+    start = time.perf_counter()
+    for i in range(ops):
+        cache.get(newest - 1 - i % size)
+    get_ns = (time.perf_counter() - start) / ops * 1e9
+
+    return put_ns, get_ns
+
+
+def main():
+    print(f"{'entries':>8}  {'put+evict':>10}  {'get':>8}")
+    for size in (1_000, 10_000, 100_000):
+        put_ns, get_ns = bench(size)
+        print(f"{size:>8}  {put_ns:>8.0f}ns  {get_ns:>6.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
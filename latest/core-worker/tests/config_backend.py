@@ -0,0 +1,91 @@
+"""In-process stand-in for the backend's runtime-config API"""
+
+import asyncio
+from typing import Any, Dict, Optional, Set
+from aiohttp import web
+
+
+class ConfigBackend:
+    """
+    Serves /api/v1/agents/{agent_id}/runtime-config on a random local port
+
+    Unknown agents get 404. With etag set, responses carry it and a matching
+    If-None-Match gets 304. The batch endpoint returns the known agents.
+    With overlays set (campaign_id -> overrides), the overlay endpoint is
+    served too; unknown campaigns get 404 and overlay_body, if set, replaces
+    every overlay response body.
+    """
+
+    def __init__(self, agents: Optional[Set[str]] = None):
+        self.agents = agents if agents is not None else {"agent-1"}
+        self.name = "Test Agent"
+        self.etag: Optional[str] = None
+        self.delay = 0.0
+        self.calls = 0
+        self.batch_calls = 0
+        self.not_modified = 0
+        self.overlays: Optional[Dict[str, Any]] = None
+        self.overlay_body: Any = None
+        self.overlay_calls = 0
+        self.url = ""
+        self._runner: Optional[web.AppRunner] = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        agent_id = request.match_info["agent_id"]
+        if agent_id not in self.agents:
+            return web.json_response({"success": False, "error": "Agent not found"}, status=404)
+
+        if self.etag and request.headers.get("If-None-Match") == self.etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": self.etag})
+
+        headers = {"ETag": self.etag} if self.etag else {}
+        return web.json_response({"success": True, "config": self._config(agent_id)}, headers=headers)
+
+    async def _handle_batch(self, request: web.Request) -> web.Response:
+        self.batch_calls += 1
+        body = await request.json()
+        configs = [
+            {"agentId": item["agentId"], "campaignId": item.get("campaignId"), "config": self._config(item["agentId"])}
+            for item in body["requests"]
+            if item["agentId"] in self.agents
+        ]
+        return web.json_response({"success": True, "configs": configs})
+
+    async def _handle_overlay(self, request: web.Request) -> web.Response:
+        self.overlay_calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        if self.overlays is None:
+            raise web.HTTPNotFound()
+        if self.overlay_body is not None:
+            return web.json_response(self.overlay_body)
+
+        campaign_id = request.query.get("campaignId")
+        if campaign_id not in self.overlays:
+            return web.json_response({"success": False, "error": "Campaign not found"}, status=404)
+        return web.json_response({"success": True, "overrides": self.overlays[campaign_id]})
+
+    def _config(self, agent_id: str) -> dict:
+        return {"agent_id": agent_id, "name": self.name, "system_prompt": "You are a test agent."}
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/api/v1/agents/{agent_id}/runtime-config", self._handle)
+        app.router.add_get("/api/v1/agents/{agent_id}/runtime-config/overlay", self._handle_overlay)
+        app.router.add_post("/api/v1/agents/runtime-config/batch", self._handle_batch)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
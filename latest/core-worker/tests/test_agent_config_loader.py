@@ -0,0 +1,209 @@
+"""Tests for config.agent_config_loader"""
+
+import asyncio
+
+from config.agent_config_loader import AgentConfigLoader
+from config.snapshot_store import ConfigSnapshotStore
+from config_backend import ConfigBackend
+
+
+def test_deleted_agent_is_not_served_from_stale_cache_or_snapshot(tmp_path):
+    snapshot_store = ConfigSnapshotStore(str(tmp_path / "snapshots.db"))
+
+    async def scenario():
+        backend = ConfigBackend()
+        await backend.start()
+        loader = AgentConfigLoader(backend.url, cache_ttl=0, snapshot_store=snapshot_store)
+        try:
+            before = await loader.load("agent-1")
+            backend.agents.clear()
+            deleted = await loader.load("agent-1")
+            again = await loader.load("agent-1")
+            snapshot = await snapshot_store.get("agent-1")
+        finally:
+            await loader.close()
+            await backend.stop()
+        return before, deleted, again, snapshot, loader.get_metrics()
+
+    before, deleted, again, snapshot, metrics = asyncio.run(scenario())
+
+    assert before.source == "api"
+    assert deleted.source == "default"
+    assert again.source == "default"
+    assert snapshot is None
+    assert metrics["negative_hits"] == 1
+    assert metrics["fallback_to_stale"] == 0
+    assert metrics["fallback_to_snapshot"] == 0
+
+
+def test_not_modified_response_reuses_cached_config():
+    async def scenario():
+        backend = ConfigBackend()
+        backend.etag = '"v1"'
+        await backend.start()
+        loader = AgentConfigLoader(backend.url, cache_ttl=0)
+        try:
+            first = await loader.load("agent-1")
+            second = await loader.load("agent-1")
+        finally:
+            await loader.close()
+            await backend.stop()
+        return first, second, loader.get_metrics(), backend
+
+    first, second, metrics, backend = asyncio.run(scenario())
+
+    assert first.source == second.source == "api"
+    assert backend.calls == 2
+    assert backend.not_modified == 1
+    assert metrics["api_not_modified"] == 1
+    assert second.config is first.config
+
+
+def test_load_reads_single_snapshot_row_and_load_snapshot_keeps_newest(tmp_path):
+    path = str(tmp_path / "snapshots.db")
+
+    async def scenario():
+        backend = ConfigBackend(agents={"a1", "a2", "a3"})
+        await backend.start()
+        writer = AgentConfigLoader(backend.url, snapshot_store=ConfigSnapshotStore(path))
+        for agent_id in ("a1", "a2", "a3"):
+            await writer.load(agent_id)
+            await asyncio.sleep(0.01)
+        await writer.close()
+        await backend.stop()
+
+        # Backend is gone: a job's first load falls back to its own row only
+        job = AgentConfigLoader(backend.url, snapshot_store=ConfigSnapshotStore(path))
+        result = await job.load("a1")
+        job_metrics = job.get_metrics()
+        await job.close()
+
+        host = AgentConfigLoader(backend.url, max_cache_size=2, snapshot_store=ConfigSnapshotStore(path))
+        await host.load_snapshot()
+        host_keys = set(host._cache)
+        host_metrics = host.get_metrics()
+        await host.close()
+        return result, job_metrics, host_keys, host_metrics
+
+    result, job_metrics, host_keys, host_metrics = asyncio.run(scenario())
+
+    assert result.source == "snapshot"
+    assert result.config.agent_id == "a1"
+    assert job_metrics["snapshot_entries_loaded"] == 0
+    assert job_metrics["fallback_to_snapshot"] == 1
+    assert host_metrics["snapshot_entries_loaded"] == 2
+    assert host_keys == {"a2", "a3"}
+
+
+def test_invalid_campaign_overrides_fall_back_to_base_config():
+    async def scenario():
+        backend = ConfigBackend()
+        backend.overlays = {"c1": {"llm_provider": "nope"}}
+        await backend.start()
+        loader = AgentConfigLoader(backend.url, campaign_overlays=True)
+        try:
+            invalid = [await loader.load("agent-1", "c1") for _ in range(2)]
+            backend.overlay_body = ["not", "an", "object"]
+            malformed = await loader.load("agent-1", "c2")
+        finally:
+            await loader.close()
+            await backend.stop()
+        return invalid, malformed, loader.get_metrics(), backend
+
+    invalid, malformed, metrics, backend = asyncio.run(scenario())
+
+    for result in invalid + [malformed]:
+        assert result.success
+        assert result.config.llm_provider == "openai"
+    assert backend.overlay_calls == 3
+    assert metrics["overlay_failures"] == 3
+
+
+def test_unknown_campaign_is_negative_cached_without_disabling_overlays():
+    async def scenario():
+        backend = ConfigBackend()
+        backend.overlays = {"c1": {"name": "Campaign Agent"}}
+        await backend.start()
+        loader = AgentConfigLoader(backend.url, campaign_overlays=True)
+        try:
+            unknown = [await loader.load("agent-1", "missing") for _ in range(2)]
+            known = await loader.load("agent-1", "c1")
+        finally:
+            await loader.close()
+            await backend.stop()
+        return unknown, known, loader, backend
+
+    unknown, known, loader, backend = asyncio.run(scenario())
+
+    assert all(result.config.name == "Test Agent" for result in unknown)
+    assert known.config.name == "Campaign Agent"
+    assert loader.campaign_overlays
+    assert backend.overlay_calls == 2
+    assert loader.get_metrics()["negative_hits"] == 1
+
+
+def test_missing_overlay_endpoint_disables_overlays():
+    async def scenario():
+        backend = ConfigBackend()
+        await backend.start()
+        loader = AgentConfigLoader(backend.url, campaign_overlays=True)
+        try:
+            result = await loader.load("agent-1", "c1")
+        finally:
+            await loader.close()
+            await backend.stop()
+        return result, loader
+
+    result, loader = asyncio.run(scenario())
+
+    assert result.success
+    assert result.source == "api"
+    assert not loader.campaign_overlays
+
+
+def test_open_circuit_skips_overlay_batch_and_preload_target_requests():
+    async def scenario():
+        backend = ConfigBackend(agents={"agent-1", "agent-2"})
+        backend.overlays = {"c1": {"name": "Campaign Agent"}}
+        await backend.start()
+        loader = AgentConfigLoader(backend.url, campaign_overlays=True, breaker_failure_threshold=1)
+        try:
+            await loader.load("agent-1")
+            loader._breaker.record_failure()
+            overlaid = await loader.load("agent-1", "c1")
+            summary = await loader.preload(["agent-2"])
+            targets = await loader.fetch_preload_targets()
+        finally:
+            await loader.close()
+            await backend.stop()
+        return overlaid, summary, targets, loader.get_metrics(), backend
+
+    overlaid, summary, targets, metrics, backend = asyncio.run(scenario())
+
+    assert overlaid.config.name == "Test Agent"
+    assert summary["loaded"] == 0
+    assert targets == []
+    assert (backend.calls, backend.batch_calls, backend.overlay_calls) == (1, 0, 0)
+    assert metrics["circuit_open_rejections"] == 4
+
+
+def test_clear_agent_cache_only_drops_that_agent():
+    async def scenario():
+        backend = ConfigBackend(agents={"a1", "a10"})
+        await backend.start()
+        loader = AgentConfigLoader(backend.url)
+        try:
+            await loader.load("a1")
+            await loader.load("a10")
+            loader.clear_agent_cache("a1")
+            a10 = await loader.load("a10")
+        finally:
+            await loader.close()
+            await backend.stop()
+        return a10, set(loader._cache), backend
+
+    a10, cached, backend = asyncio.run(scenario())
+
+    assert cached == {"a10"}
+    assert a10.cache_hit
+    assert backend.calls == 2
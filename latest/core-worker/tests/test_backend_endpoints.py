@@ -0,0 +1,111 @@
+"""Tests for config.backend_endpoints"""
+
+import asyncio
+from typing import Optional
+
+import aiohttp
+
+from config.backend_endpoints import EndpointSelector
+from config_backend import ConfigBackend
+
+
+async def fetch_name(session: aiohttp.ClientSession, base_url: str) -> Optional[str]:
+    """Request agent-1's config from one endpoint, returning the backend's name"""
+    try:
+        async with session.get(f"{base_url}/api/v1/agents/agent-1/runtime-config") as response:
+            if response.status != 200:
+                return None
+            return (await response.json())["config"]["name"]
+    except aiohttp.ClientError:
+        return None
+
+
+async def start_backends():
+    first, second = ConfigBackend(), ConfigBackend()
+    first.name, second.name = "first", "second"
+    await first.start()
+    await second.start()
+    return first, second
+
+
+def test_failed_request_fails_over_to_next_endpoint():
+    async def scenario():
+        first, second = await start_backends()
+        first.agents.clear()
+        selector = EndpointSelector([first.url, second.url])
+        try:
+            async with aiohttp.ClientSession() as session:
+                result = await selector.request(lambda url: fetch_name(session, url))
+        finally:
+            await first.stop()
+            await second.stop()
+        return result, selector, first, second
+
+    result, selector, first, second = asyncio.run(scenario())
+
+    assert result == "second"
+    assert selector.failovers == 1
+    assert (first.calls, second.calls) == (1, 1)
+    assert selector.endpoints[0].failures == 1
+
+
+def test_hedged_request_wins_on_fast_endpoint_and_cancels_slow_one():
+    async def scenario():
+        first, second = await start_backends()
+        first.delay = 0.5
+        selector = EndpointSelector([first.url, second.url], min_hedge_samples=1)
+        slow, fast = selector.endpoints
+        selector.record(slow, 0.01, ok=True)
+        selector.record(fast, 0.05, ok=True)
+        try:
+            async with aiohttp.ClientSession() as session:
+                start = asyncio.get_running_loop().time()
+                result = await selector.request(lambda url: fetch_name(session, url), hedge=True)
+                elapsed = asyncio.get_running_loop().time() - start
+        finally:
+            await first.stop()
+            await second.stop()
+        return result, elapsed, selector
+
+    result, elapsed, selector = asyncio.run(scenario())
+    slow, fast = selector.endpoints
+
+    assert result == "second"
+    assert elapsed < 0.4
+    assert selector.hedged_requests == 1
+    assert selector.hedge_wins == 1
+    assert selector.failovers == 0
+    # The cancelled loser only contributes a latency sample, not a failure
+    assert (slow.requests, slow.failures) == (1, 0)
+    assert fast.requests == 2
+
+
+def test_unhealthy_endpoint_is_probed_after_interval():
+    now = [100.0]
+
+    async def scenario():
+        first, second = await start_backends()
+        selector = EndpointSelector([first.url, second.url], probe_interval=10.0, clock=lambda: now[0])
+        unhealthy, healthy = selector.endpoints
+        for _ in range(5):
+            selector.record(unhealthy, None, ok=False)
+        unhealthy.last_used = now[0]
+        selector.record(healthy, 0.01, ok=True)
+        try:
+            async with aiohttp.ClientSession() as session:
+                before = await selector.request(lambda url: fetch_name(session, url))
+                now[0] += 10.0
+                probe = await selector.request(lambda url: fetch_name(session, url))
+        finally:
+            await first.stop()
+            await second.stop()
+        return before, probe, selector, first
+
+    before, probe, selector, first = asyncio.run(scenario())
+    unhealthy, _ = selector.endpoints
+
+    assert before == "second"
+    assert probe == "first"
+    assert first.calls == 1
+    assert unhealthy.requests == 6
+    assert unhealthy.failures == 5
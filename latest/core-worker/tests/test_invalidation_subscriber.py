@@ -0,0 +1,101 @@
+"""Tests for config.invalidation_subscriber"""
+
+import asyncio
+import json
+from aiohttp import web
+
+from config.agent_config_loader import AgentConfigLoader
+from config.invalidation_subscriber import ConfigInvalidationSubscriber
+from config.shared_cache import SharedConfigCache
+from config_backend import ConfigBackend
+
+
+class EventStream:
+    """SSE endpoint that sends the queued events, then closes the connection"""
+
+    def __init__(self):
+        self.events = []
+        self.last_event_ids = []
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        self.last_event_ids.append(request.headers.get("Last-Event-ID"))
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        while self.events:
+            event_id, event = self.events.pop(0)
+            block = f"id: {event_id}\n" if event_id is not None else ""
+            await response.write(f"{block}data: {json.dumps(event)}\n\n".encode("utf-8"))
+        await asyncio.sleep(0.05)
+        return response
+
+
+async def start_event_stream(stream: EventStream):
+    app = web.Application()
+    app.router.add_get("/events", stream.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/events"
+
+
+def test_connect_without_event_ids_drops_local_and_shared_cache(tmp_path):
+    shared_cache = SharedConfigCache(str(tmp_path / "config.db"))
+
+    async def scenario():
+        backend = ConfigBackend()
+        await backend.start()
+        stream = EventStream()
+        runner, url = await start_event_stream(stream)
+        loader = AgentConfigLoader(backend.url, shared_cache=shared_cache)
+        subscriber = ConfigInvalidationSubscriber(loader, url, min_backoff=0.01)
+        try:
+            await loader.load("agent-1")
+            subscriber.ensure_started()
+            connected = await subscriber.wait_connected(timeout=5)
+            shared = await shared_cache.get("agent-1")
+        finally:
+            await subscriber.stop()
+            await loader.close()
+            await runner.cleanup()
+            await backend.stop()
+        return connected, shared, loader.get_metrics(), subscriber
+
+    connected, shared, metrics, subscriber = asyncio.run(scenario())
+
+    assert connected
+    assert subscriber.resyncs >= 1
+    assert metrics["cache_size"] == 0
+    assert shared is None
+
+
+def test_reconnect_resumes_from_last_event_id():
+    async def scenario():
+        backend = ConfigBackend()
+        await backend.start()
+        stream = EventStream()
+        stream.events.append(("41", {"type": "agent.updated", "agentId": "agent-1"}))
+        runner, url = await start_event_stream(stream)
+        loader = AgentConfigLoader(backend.url)
+        subscriber = ConfigInvalidationSubscriber(loader, url, refresh=False, min_backoff=0.01)
+        try:
+            subscriber.ensure_started()
+            await subscriber.wait_connected(timeout=5)
+            for _ in range(100):
+                if len(stream.last_event_ids) >= 2:
+                    break
+                await asyncio.sleep(0.02)
+        finally:
+            await subscriber.stop()
+            await loader.close()
+            await runner.cleanup()
+            await backend.stop()
+        return stream.last_event_ids, subscriber
+
+    last_event_ids, subscriber = asyncio.run(scenario())
+
+    assert last_event_ids[:2] == [None, "41"]
+    assert subscriber.events_received == 1
+    # Only the first connect (no event ID yet) dropped the cache
+    assert subscriber.resyncs == 1
@@ -0,0 +1,107 @@
+"""Tests for utils.lru_cache"""
+
+import pytest
+
+from utils.lru_cache import LRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")  # "b" is now least recently used
+
+    evicted = cache.put("c", 3)
+
+    assert evicted == [("b", 2)]
+    assert list(cache) == ["a", "c"]
+    assert cache.evictions == 1
+
+
+def test_peek_does_not_change_order():
+    cache = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.peek("a")
+
+    assert cache.put("c", 3) == [("a", 1)]
+
+
+def test_replacing_a_key_does_not_evict():
+    cache = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    assert cache.put("a", 10) == []
+    assert cache.get("a") == 10
+    assert list(cache) == ["b", "a"]
+
+
+def test_ttl_expiry_keeps_stale_value():
+    clock = FakeClock()
+    cache = LRUCache(max_size=10, ttl=30, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2, ttl=60)
+
+    clock.now += 31
+
+    assert cache.get("a") is None
+    assert cache.is_expired("a")
+    assert cache.get("a", ignore_ttl=True) == 1
+    assert cache.get("b") == 2
+    assert cache.expires_at("b") == 1060.0
+
+
+def test_byte_budget_evicts_until_under_limit():
+    cache = LRUCache(max_size=100, max_bytes=10, sizeof=len)
+    cache.put("a", "xxxx")
+    cache.put("b", "xxxx")
+
+    evicted = cache.put("c", "xxxxxxx")
+
+    assert evicted == [("a", "xxxx"), ("b", "xxxx")]
+    assert cache.total_bytes == 7
+
+
+def test_byte_budget_allows_exact_fit():
+    cache = LRUCache(max_size=100, max_bytes=10, sizeof=len)
+    cache.put("a", "xxxx")
+    cache.put("b", "xxxx")
+
+    assert cache.put("c", "xx") == []
+    assert cache.total_bytes == 10
+
+
+def test_byte_budget_keeps_oversized_newest_entry():
+    cache = LRUCache(max_size=100, max_bytes=10, sizeof=len)
+    cache.put("a", "x")
+
+    assert cache.put("big", "x" * 50) == [("a", "x")]
+    assert cache.get("big") == "x" * 50
+    assert cache.total_bytes == 50
+
+
+def test_byte_accounting_on_replace_and_pop():
+    cache = LRUCache(max_size=10, max_bytes=100, sizeof=len)
+    cache.put("a", "xxxx")
+    cache.put("a", "xx")
+    assert cache.total_bytes == 2
+
+    assert cache.pop("a") == "xx"
+    assert cache.pop("a") is None
+    assert cache.total_bytes == 0
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        LRUCache(max_size=0)
+    with pytest.raises(ValueError):
+        LRUCache(max_size=10, max_bytes=100)
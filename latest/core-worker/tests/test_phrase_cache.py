@@ -0,0 +1,58 @@
+"""Tests for audio.phrase_cache"""
+
+import asyncio
+
+import pytest
+
+rtc = pytest.importorskip("livekit.rtc")
+
+from audio.phrase_cache import PhraseAudioCache  # noqa: E402
+
+
+async def text_stream(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def fake_tts_node(calls):
+    async def tts_node(text):
+        calls.append("".join([chunk async for chunk in text]))
+        for _ in range(3):
+            yield rtc.AudioFrame(data=b"\x00\x00" * 480, sample_rate=24000, num_channels=1, samples_per_channel=480)
+    return tts_node
+
+
+async def speak(cache, tts_node, *chunks):
+    frames = [frame async for frame in cache.synthesize("cartesia", "voice", text_stream(*chunks), tts_node)]
+    await asyncio.sleep(0.05)  # let the background store finish
+    return frames
+
+
+def test_allowlisted_phrase_is_replayed_from_disk(tmp_path):
+    calls = []
+    cache = PhraseAudioCache(str(tmp_path), phrases=["Please hold on."])
+    tts_node = fake_tts_node(calls)
+
+    async def scenario():
+        first = await speak(cache, tts_node, "Please ", "hold ", "on.")
+        second = await speak(cache, tts_node, "Please  hold on.")
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert len(first) == len(second) == 3
+    assert calls == ["Please hold on."]
+    assert cache.get_metrics()["hits"] == 1
+
+
+def test_other_text_streams_through_and_is_not_stored(tmp_path):
+    calls = []
+    cache = PhraseAudioCache(str(tmp_path), phrases=["Please hold on."])
+    tts_node = fake_tts_node(calls)
+
+    asyncio.run(speak(cache, tts_node, "Please ", "hold ", "the line, ", "your order ships tomorrow."))
+    asyncio.run(speak(cache, tts_node, "Your balance is $42."))
+
+    assert calls == ["Please hold the line, your order ships tomorrow.", "Your balance is $42."]
+    assert cache.get_metrics()["bypassed"] == 2
+    assert cache.get_metrics()["disk_entries"] == 0
@@ -0,0 +1,59 @@
+"""Tests for utils.resilience"""
+
+from utils.resilience import AdaptiveTimeout, CircuitBreaker
+
+
+def test_adaptive_timeout_starts_at_max():
+    timeout = AdaptiveTimeout(min_timeout=1.0, max_timeout=5.0)
+    assert timeout.current() == 5.0
+
+
+def test_adaptive_timeout_shrinks_to_floor_on_fast_responses():
+    timeout = AdaptiveTimeout(min_timeout=1.0, max_timeout=5.0, min_samples=20)
+    for _ in range(25):
+        timeout.record(0.01)
+    assert timeout.current() == 1.0
+
+
+def test_adaptive_timeout_recovers_after_backend_slows_down():
+    timeout = AdaptiveTimeout(min_timeout=1.0, max_timeout=5.0, min_samples=20)
+    for _ in range(200):
+        timeout.record(0.01)
+    assert timeout.current() == 1.0
+
+    # Backend now answers in 1.3s: the first request times out at 1.0s
+    timeout.record_timeout(timeout.current())
+    assert timeout.current() == 2.0
+
+    # Every following request fits under the backed-off timeout, which
+    # must not shrink back below 1.3s while the window re-learns
+    for _ in range(30):
+        assert timeout.current() > 1.3
+        timeout.record(1.3)
+    assert timeout.current() >= 2.6 - 1e-9
+    assert timeout.timeouts == 1
+
+
+def test_adaptive_timeout_backoff_is_capped():
+    timeout = AdaptiveTimeout(min_timeout=1.0, max_timeout=5.0)
+    for _ in range(5):
+        timeout.record_timeout(timeout.current())
+    assert timeout.current() == 5.0
+
+
+def test_circuit_breaker_opens_and_probes():
+    now = [0.0]
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=10, clock=lambda: now[0])
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+    now[0] = 11
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow_request()  # one probe at a time
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
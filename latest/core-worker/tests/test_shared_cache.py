@@ -0,0 +1,89 @@
+"""Tests for config.shared_cache and its use by AgentConfigLoader"""
+
+import asyncio
+
+from config.agent_config_loader import AgentConfigLoader
+from config.shared_cache import SharedConfigCache
+from config_backend import ConfigBackend
+
+
+def test_unusable_path_disables_shared_cache(tmp_path):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    shared_cache = SharedConfigCache(str(blocker / "config.db"))
+
+    async def scenario():
+        backend = ConfigBackend()
+        await backend.start()
+        loader = AgentConfigLoader(backend.url, shared_cache=shared_cache)
+        try:
+            first = await loader.load("agent-1")
+            second = await loader.load("agent-1")
+        finally:
+            await loader.close()
+            await backend.stop()
+        return first, second, backend.calls
+
+    first, second, calls = asyncio.run(scenario())
+
+    assert first.source == "api"
+    assert first.config.name == "Test Agent"
+    assert second.cache_hit
+    assert calls == 1
+    assert not shared_cache.available
+
+
+def test_refresh_ahead_refetches_despite_shared_entry(tmp_path):
+    shared_cache = SharedConfigCache(str(tmp_path / "config.db"))
+
+    async def scenario():
+        backend = ConfigBackend()
+        await backend.start()
+        loader = AgentConfigLoader(
+            backend.url,
+            cache_ttl=2,
+            refresh_ahead_window=1.5,
+            refresh_ahead_min_hits=1,
+            shared_cache=shared_cache,
+        )
+        try:
+            await loader.load("agent-1")
+            await loader.load("agent-1")
+            # The first scheduler tick (t=1s) refreshes the entry expiring at t=2s
+            await asyncio.sleep(2.5)
+            result = await loader.load("agent-1")
+        finally:
+            await loader.close()
+            await backend.stop()
+        return result, backend.calls
+
+    result, calls = asyncio.run(scenario())
+
+    assert result.cache_hit
+    assert calls >= 2
+
+
+def test_batch_preload_fills_shared_cache(tmp_path):
+    path = str(tmp_path / "config.db")
+
+    async def scenario():
+        backend = ConfigBackend(agents={"agent-1", "agent-2"})
+        await backend.start()
+        host_loader = AgentConfigLoader(backend.url, shared_cache=SharedConfigCache(path))
+        job_loader = AgentConfigLoader(backend.url, shared_cache=SharedConfigCache(path))
+        try:
+            summary = await host_loader.preload(["agent-1", "agent-2"])
+            result = await job_loader.load("agent-2")
+        finally:
+            await host_loader.close()
+            await job_loader.close()
+            await backend.stop()
+        return summary, result, job_loader.get_metrics(), backend
+
+    summary, result, metrics, backend = asyncio.run(scenario())
+
+    assert summary["batched"] == 2
+    assert result.config.agent_id == "agent-2"
+    assert metrics["shared_cache_hits"] == 1
+    assert backend.batch_calls == 1
+    assert backend.calls == 0
@@ -1,5 +1,23 @@
 """Utility functions and helpers"""
 
-from .logger import setup_logger, get_logger, log_call_start, log_call_end, log_config_fetch, log_error
+from .logger import setup_logger, get_logger, log_call_start, log_call_end, log_call_latency, log_config_load_latency, log_config_fetch, log_error
+from .lru_cache import LRUCache
+from .resilience import CircuitBreaker, AdaptiveTimeout
+from .histogram import LatencyHistogram
+from .turn_latency import TurnLatencyTracer
 
-__all__ = ["setup_logger", "get_logger", "log_call_start", "log_call_end", "log_config_fetch", "log_error"]
+__all__ = [
+    "setup_logger",
+    "get_logger",
+    "log_call_start",
+    "log_call_end",
+    "log_call_latency",
+    "log_config_load_latency",
+    "log_config_fetch",
+    "log_error",
+    "LRUCache",
+    "CircuitBreaker",
+    "AdaptiveTimeout",
+    "LatencyHistogram",
+    "TurnLatencyTracer",
+]
@@ -0,0 +1,100 @@
+"""
+Fixed-bucket latency histogram
+
+Recording is a bisect plus two additions, cheap enough for every call on
+the hot path. Percentiles are estimated by linear interpolation inside the
+bucket that contains them, so their resolution is the bucket width.
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence
+
+
+# Bucket upper bounds in milliseconds (sub-ms for cache hits up to multi-second
+# backend timeouts); one extra overflow bucket catches everything above
+DEFAULT_BOUNDS_MS = (
+    0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 300, 500,
+    750, 1000, 1500, 2000, 3000, 5000, 10000,
+)
+
+
+class LatencyHistogram:
+    """
+    Latency histogram with fixed bucket bounds
+
+    Usage:
+        hist = LatencyHistogram()
+        hist.record(12.5)
+        hist.percentile(0.95)  # ms
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total_ms", "max_ms")
+
+    def __init__(self, bounds_ms: Sequence[float] = DEFAULT_BOUNDS_MS):
+        """
+        Initialize histogram
+
+        Args:
+            bounds_ms: Ascending bucket upper bounds in milliseconds
+        """
+        self.bounds: List[float] = list(bounds_ms)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, value_ms: float):
+        """Record one latency in milliseconds"""
+        self.counts[bisect_left(self.bounds, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Estimate a percentile
+
+        Args:
+            q: Quantile between 0 and 1 (e.g. 0.95)
+
+        Returns:
+            Latency in milliseconds, None if nothing was recorded
+        """
+        if self.count == 0:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.bounds[i - 1] if i > 0 else 0.0
+                upper = self.bounds[i] if i < len(self.bounds) else self.max_ms
+                fraction = (rank - seen) / bucket_count
+                return min(lower + (upper - lower) * fraction, self.max_ms)
+            seen += bucket_count
+        return self.max_ms
+
+    def merge(self, other: "LatencyHistogram"):
+        """Add another histogram with the same bounds into this one"""
+        if other.bounds != self.bounds:
+            raise ValueError("Cannot merge histograms with different bounds")
+        for i, bucket_count in enumerate(other.counts):
+            self.counts[i] += bucket_count
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary for metrics: count, mean, p50/p95/p99 and max in ms"""
+        def rounded(value: Optional[float]) -> Optional[float]:
+            return round(value, 2) if value is not None else None
+
+        return {
+            "count": self.count,
+            "mean_ms": rounded(self.total_ms / self.count) if self.count else None,
+            "p50_ms": rounded(self.percentile(0.50)),
+            "p95_ms": rounded(self.percentile(0.95)),
+            "p99_ms": rounded(self.percentile(0.99)),
+            "max_ms": rounded(self.max_ms) if self.count else None,
+        }
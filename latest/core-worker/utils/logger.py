@@ -39,6 +39,14 @@ class StructuredFormatter(logging.Formatter):
             log_data["room_name"] = record.room_name
         if hasattr(record, "duration_ms"):
             log_data["duration_ms"] = record.duration_ms
+        if hasattr(record, "startup_timings_ms"):
+            log_data["startup_timings_ms"] = record.startup_timings_ms
+        if hasattr(record, "turn_latency"):
+            log_data["turn_latency"] = record.turn_latency
+        if hasattr(record, "config_load_latency"):
+            log_data["config_load_latency"] = record.config_load_latency
+        if hasattr(record, "phrase_cache"):
+            log_data["phrase_cache"] = record.phrase_cache
 
         # Add exception info if present
         if record.exc_info:
@@ -220,6 +228,39 @@ def log_call_end(logger: logging.Logger, agent_id: str, room_name: str, duration
     )
 
 
+def log_call_latency(logger: logging.Logger, agent_id: str, room_name: str, summary: Dict[str, Any]):
+    """Log per-call turn latency summary (TurnLatencyTracer.summary()) with structured data"""
+    stages = summary["stages"]
+    parts = [
+        f"{stage} p50 {stats['p50_ms']}ms/p95 {stats['p95_ms']}ms"
+        for stage, stats in stages.items()
+    ]
+    logger.info(
+        f"⏱️  Turn latency over {summary['turns']} turns: " + (", ".join(parts) or "no samples"),
+        extra={
+            "agent_id": agent_id,
+            "room_name": room_name,
+            "turn_latency": summary,
+        }
+    )
+
+
+def log_config_load_latency(logger: logging.Logger, agent_id: str, room_name: str, metrics: Dict[str, Any]):
+    """Log a job process's config load latency (AgentConfigLoader.get_metrics()) with structured data"""
+    latency = metrics["load_latency"]
+    by_result = metrics["load_latency_by_result"]
+    results = ", ".join(f"{label} x{stats['count']}" for label, stats in by_result.items())
+    logger.info(
+        f"⏱️  Config load latency over {latency['count']} loads: p50 {latency['p50_ms']}ms, "
+        f"p95 {latency['p95_ms']}ms, p99 {latency['p99_ms']}ms ({results or 'no loads'})",
+        extra={
+            "agent_id": agent_id,
+            "room_name": room_name,
+            "config_load_latency": {"overall": latency, "by_result": by_result},
+        }
+    )
+
+
 def log_config_fetch(
     logger: logging.Logger,
     agent_id: str,
@@ -0,0 +1,187 @@
+"""
+LRU cache with lazy TTL expiry
+
+O(1) get/put/evict on top of an OrderedDict. Reads move entries to the
+most-recently-used end; when full (by entry count or, optionally, by an
+approximate byte budget), least-recently-used entries are evicted.
+Expiry is checked on read only (no timers), and expired entries are kept
+until evicted so callers can still fall back to stale values.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Iterator, List, Optional, Tuple, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class _Entry(Generic[V]):
+    """Cached value plus its absolute expiry time and size"""
+
+    __slots__ = ("value", "expires_at", "size")
+
+    def __init__(self, value: V, expires_at: Optional[float], size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Size-bounded LRU cache with per-entry TTL
+
+    Usage:
+        cache = LRUCache(max_size=1000, ttl=300)
+        cache.put("agent-1", config)
+        cache.get("agent-1")                   # fresh entries only
+        cache.get("agent-1", ignore_ttl=True)  # stale entries too
+
+        # Byte-bounded: sizeof(value) is summed and kept under max_bytes
+        cache = LRUCache(max_size=1000, max_bytes=16 << 20, sizeof=lambda v: v.nbytes)
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[V], int]] = None
+    ):
+        """
+        Initialize cache
+
+        Args:
+            max_size: Maximum number of entries before LRU eviction
+            ttl: Default time-to-live in seconds (None = never expires)
+            clock: Time source, in seconds
+            max_bytes: Approximate byte budget across all entries (None = no
+                limit). The most recently inserted entry is always kept.
+            sizeof: Size of a value in bytes (required with max_bytes)
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        if max_bytes is not None and sizeof is None:
+            raise ValueError("sizeof is required when max_bytes is set")
+
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._sizeof = sizeof
+        self._data: "OrderedDict[K, _Entry[V]]" = OrderedDict()
+        self.total_bytes = 0
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(list(self._data.keys()))
+
+    def get(self, key: K, ignore_ttl: bool = False) -> Optional[V]:
+        """
+        Get value and mark it most recently used
+
+        Args:
+            key: Cache key
+            ignore_ttl: If True, return even expired entries
+
+        Returns:
+            Cached value, or None if missing (or expired and not ignore_ttl)
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if not ignore_ttl and self._expired(entry, self._clock()):
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def peek(self, key: K) -> Optional[V]:
+        """Get value regardless of TTL without touching recency or stats"""
+        entry = self._data.get(key)
+        return entry.value if entry is not None else None
+
+    def put(self, key: K, value: V, ttl: Optional[float] = None) -> List[Tuple[K, V]]:
+        """
+        Insert or replace a value as most recently used
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live override in seconds (defaults to cache ttl)
+
+        Returns:
+            (key, value) of each evicted entry, least recently used first
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self._clock() + ttl if ttl is not None else None
+        size = self._sizeof(value) if self._sizeof is not None else 0
+
+        entry = self._data.get(key)
+        if entry is not None:
+            self.total_bytes += size - entry.size
+            entry.value = value
+            entry.expires_at = expires_at
+            entry.size = size
+            self._data.move_to_end(key)
+        else:
+            self._data[key] = _Entry(value, expires_at, size)
+            self.total_bytes += size
+
+        evicted = []
+        while len(self._data) > 1 and (
+            len(self._data) > self.max_size
+            or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            old_key, old_entry = self._data.popitem(last=False)
+            self.total_bytes -= old_entry.size
+            self.evictions += 1
+            evicted.append((old_key, old_entry.value))
+        return evicted
+
+    def pop(self, key: K) -> Optional[V]:
+        """Remove and return a value (None if missing)"""
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return None
+        self.total_bytes -= entry.size
+        return entry.value
+
+    def is_expired(self, key: K) -> bool:
+        """Check whether a key is missing or past its TTL"""
+        entry = self._data.get(key)
+        return entry is None or self._expired(entry, self._clock())
+
+    def expires_at(self, key: K) -> Optional[float]:
+        """Get absolute expiry time of a key (None if missing or no TTL)"""
+        entry = self._data.get(key)
+        return entry.expires_at if entry is not None else None
+
+    def items(self) -> Iterator[Tuple[K, V]]:
+        """Iterate (key, value) pairs from least to most recently used"""
+        return iter([(k, e.value) for k, e in self._data.items()])
+
+    def clear(self):
+        """Remove all entries"""
+        self._data.clear()
+        self.total_bytes = 0
+
+    @staticmethod
+    def _expired(entry: _Entry, now: float) -> bool:
+        return entry.expires_at is not None and now > entry.expires_at
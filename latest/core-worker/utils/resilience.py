@@ -0,0 +1,195 @@
+"""
+Resilience helpers for backend calls
+
+CircuitBreaker fails fast while a dependency is down; AdaptiveTimeout
+sizes request timeouts from observed latency instead of a fixed value.
+"""
+
+import logging
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Dict
+
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker
+
+    States:
+    - closed: requests flow; failure_threshold consecutive failures open it
+    - open: requests are rejected until reset_timeout has passed
+    - half_open: one probe request is let through; success closes the
+      breaker, failure re-opens it
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize breaker
+
+        Args:
+            name: Name used in logs
+            failure_threshold: Consecutive failures before opening
+            reset_timeout: Seconds to stay open before probing
+            clock: Time source, in seconds
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+        # Stats
+        self.times_opened = 0
+        self.rejected = 0
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent now"""
+        if self.state == self.CLOSED:
+            return True
+
+        if self.state == self.OPEN:
+            if self._clock() - self._opened_at < self.reset_timeout:
+                self.rejected += 1
+                return False
+            self._transition(self.HALF_OPEN)
+
+        # Half-open: a single probe at a time
+        if self._probe_in_flight:
+            self.rejected += 1
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self):
+        """Report a successful request"""
+        self._probe_in_flight = False
+        self.consecutive_failures = 0
+        if self.state != self.CLOSED:
+            self._transition(self.CLOSED)
+
+    def record_failure(self):
+        """Report a failed request"""
+        self._probe_in_flight = False
+        self.consecutive_failures += 1
+
+        if self.state == self.HALF_OPEN or (
+            self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold
+        ):
+            self._opened_at = self._clock()
+            self.times_opened += 1
+            self._transition(self.OPEN)
+
+    def _transition(self, new_state: str):
+        old_state, self.state = self.state, new_state
+        log = logger.warning if new_state == self.OPEN else logger.info
+        log(
+            f"Circuit breaker '{self.name}': {old_state} -> {new_state} "
+            f"(consecutive failures: {self.consecutive_failures})"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Breaker state for metrics"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+        }
+
+
+class AdaptiveTimeout:
+    """
+    Request timeout derived from recent latency
+
+    timeout = clamp(p99 of the last `window` requests * multiplier,
+                    min_timeout, max_timeout)
+    Until min_samples latencies have been seen, max_timeout is used.
+
+    A timed-out request counts as a sample at the limit it hit, and backs
+    the timeout off by `multiplier` right away; it then doesn't shrink
+    again until min_samples requests have completed since the last
+    timeout, so a backend that got slower is re-learned instead of being
+    locked out by a timeout tuned to its old latency.
+    """
+
+    def __init__(
+        self,
+        min_timeout: float = 1.0,
+        max_timeout: float = 5.0,
+        multiplier: float = 2.0,
+        window: int = 200,
+        min_samples: int = 20
+    ):
+        """
+        Initialize adaptive timeout
+
+        Args:
+            min_timeout: Lower bound in seconds
+            max_timeout: Upper bound (and initial value) in seconds
+            multiplier: Headroom applied to observed p99, and backoff
+                factor after a timeout
+            window: Number of recent latencies kept
+            min_samples: Samples needed before adapting (and before
+                shrinking again after a timeout)
+        """
+        self.min_timeout = min(min_timeout, max_timeout)
+        self.max_timeout = max_timeout
+        self.multiplier = multiplier
+        self.min_samples = min_samples
+        self._samples: deque = deque(maxlen=window)
+        self._current = max_timeout
+        self._since_timeout = min_samples
+
+        # Stats
+        self.timeouts = 0
+
+    def _recompute(self):
+        if len(self._samples) < self.min_samples:
+            return
+
+        ordered = sorted(self._samples)
+        p99 = ordered[min(len(ordered) - 1, math.ceil(0.99 * len(ordered)) - 1)]
+        target = min(self.max_timeout, max(self.min_timeout, p99 * self.multiplier))
+        if target < self._current and self._since_timeout < self.min_samples:
+            return  # recently backed off; don't shrink yet
+        self._current = target
+
+    def record(self, latency_s: float):
+        """Record latency of a completed request and recompute the timeout"""
+        self._samples.append(latency_s)
+        self._since_timeout += 1
+        self._recompute()
+
+    def record_timeout(self, limit_s: float):
+        """
+        Record a request that timed out
+
+        Args:
+            limit_s: Timeout the request was sent with
+        """
+        self.timeouts += 1
+        self._samples.append(limit_s)
+        self._since_timeout = 0
+        self._current = min(self.max_timeout, max(self._current, limit_s) * self.multiplier)
+
+    def current(self) -> float:
+        """Current timeout in seconds"""
+        return self._current
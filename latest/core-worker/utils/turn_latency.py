@@ -0,0 +1,106 @@
+"""
+Turn Latency Tracing
+
+Collects per-turn stage timings of the STT -> LLM -> TTS pipeline from
+AgentSession events into latency histograms:
+
+    stt          end of user speech -> final transcript (EOU metrics)
+    end_of_turn  end of user speech -> turn committed, incl. turn detection
+    llm_ttft     LLM request -> first token
+    tts_ttfb     first text sent to TTS -> first audio byte
+    response     end of user speech (VAD) -> agent starts speaking
+    first_audio  room connected -> first agent speech
+
+One tracer is attached per call. Job processes don't outlive their call,
+so each call's summary is logged as structured data (log_call_latency)
+and aggregated across calls from the logs.
+"""
+
+import time
+from typing import Any, Callable, Dict, Optional
+from .histogram import LatencyHistogram
+
+
+STAGES = ("stt", "end_of_turn", "llm_ttft", "tts_ttfb", "response", "first_audio")
+
+
+class TurnLatencyTracer:
+    """
+    Turn pipeline stage latencies
+
+    Usage:
+        tracer = TurnLatencyTracer()
+        tracer.attach(session)
+        tracer.mark_connected()
+        ...
+        tracer.summary()
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        """
+        Initialize tracer
+
+        Args:
+            clock: Wall-clock time source, in seconds (same clock as
+                AgentSession event timestamps)
+        """
+        self.stages: Dict[str, LatencyHistogram] = {stage: LatencyHistogram() for stage in STAGES}
+        self.turns = 0
+        self._clock = clock
+        self._connected_at: Optional[float] = None
+        self._user_stopped_at: Optional[float] = None
+
+    def attach(self, session):
+        """Subscribe to an AgentSession's events (before session.start)"""
+        session.on("metrics_collected", self.on_metrics_collected)
+        session.on("user_state_changed", self.on_user_state_changed)
+        session.on("agent_state_changed", self.on_agent_state_changed)
+
+    def mark_connected(self, at: Optional[float] = None):
+        """Record when the room connection completed (start of first_audio)"""
+        self._connected_at = at if at is not None else self._clock()
+
+    def _record(self, stage: str, seconds: Optional[float]):
+        # Plugins report -1 for stages that did not happen (e.g. no token)
+        if seconds is not None and seconds >= 0:
+            self.stages[stage].record(seconds * 1000)
+
+    def on_metrics_collected(self, event):
+        """Handle a MetricsCollectedEvent"""
+        metrics = event.metrics
+        if metrics.type == "eou_metrics":
+            self._record("stt", metrics.transcription_delay)
+            self._record("end_of_turn", metrics.end_of_utterance_delay)
+        elif metrics.type == "llm_metrics" and not metrics.cancelled:
+            self._record("llm_ttft", metrics.ttft)
+        elif metrics.type == "tts_metrics" and not metrics.cancelled:
+            self._record("tts_ttfb", metrics.ttfb)
+
+    def on_user_state_changed(self, event):
+        """Handle a UserStateChangedEvent"""
+        if event.old_state == "speaking" and event.new_state != "speaking":
+            self._user_stopped_at = event.created_at
+
+    def on_agent_state_changed(self, event):
+        """Handle an AgentStateChangedEvent"""
+        if event.new_state != "speaking":
+            return
+
+        if self._connected_at is not None and self.stages["first_audio"].count == 0:
+            self._record("first_audio", event.created_at - self._connected_at)
+
+        if self._user_stopped_at is not None:
+            self.turns += 1
+            self._record("response", event.created_at - self._user_stopped_at)
+            self._user_stopped_at = None
+
+    def summary(self) -> Dict[str, Any]:
+        """Turn count and per-stage percentiles (stages without samples omitted)"""
+        return {
+            "turns": self.turns,
+            "stages": {
+                stage: histogram.to_dict()
+                for stage, histogram in self.stages.items()
+                if histogram.count
+            },
+        }